@@ -0,0 +1,56 @@
+"""Numeric core of the threshold rule check.
+
+Pure float arithmetic factored out of ThresholdDetector._check_rule so
+the hot path runs without attribute lookups or object construction.
+Unset thresholds are passed as NaN sentinels. When numba is installed
+the kernel is JIT-compiled; otherwise the plain-Python version runs.
+"""
+
+import math
+
+# Which check fired (0 = none)
+CHECK_NONE = 0
+CHECK_MAX = 1
+CHECK_MIN = 2
+CHECK_TRIGGER = 3
+CHECK_CHANGE = 4
+
+
+def check(
+    value: float,
+    old_value: float,
+    max_abs: float,
+    min_abs: float,
+    trigger_above: float,
+    min_change_pct: float
+) -> tuple[int, float]:
+    """Evaluate a rule's thresholds against a value.
+
+    Args:
+        value: Current parameter value
+        old_value: Value at the start of the lookback window (NaN if unknown)
+        max_abs/min_abs/trigger_above/min_change_pct: Rule thresholds, NaN when unset
+
+    Returns:
+        (fired check code, change_pct) — change_pct is NaN unless the
+        percentage-change branch was evaluated.
+    """
+    if not math.isnan(max_abs) and value > max_abs:
+        return CHECK_MAX, math.nan
+    if not math.isnan(min_abs) and value < min_abs:
+        return CHECK_MIN, math.nan
+    if not math.isnan(trigger_above) and value >= trigger_above:
+        return CHECK_TRIGGER, math.nan
+    if not math.isnan(min_change_pct) and not math.isnan(old_value) and old_value != 0.0:
+        change_pct = abs((value - old_value) / old_value * 100.0)
+        if change_pct >= min_change_pct:
+            return CHECK_CHANGE, change_pct
+        return CHECK_NONE, change_pct
+    return CHECK_NONE, math.nan
+
+
+try:
+    from numba import njit
+    check = njit(cache=True)(check)
+except ImportError:
+    pass
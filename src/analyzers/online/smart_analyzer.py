@@ -11,12 +11,90 @@ import logging
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Any
+
+import numpy as np
 
 from ...core.types import AnomalyEvent, Event
 
 logger = logging.getLogger(__name__)
 
+# Samples kept per parameter in the history ring buffers
+HISTORY_LEN = 200
+
+
+def _scan_correlations(
+    ts: np.ndarray,
+    val: np.ndarray,
+    counts: np.ndarray,
+    anomaly_time: float,
+    window: float,
+    min_change_pct: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scan all parameter rings for significant moves near anomaly_time.
+
+    Operates on the (P, HISTORY_LEN) ring arrays in one vectorized sweep
+    and returns (row indices, change percentages) for parameters whose
+    mean within the window deviates from their overall mean by more than
+    min_change_pct percent.
+    """
+    if counts.shape[0] == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    cols = np.arange(ts.shape[1])
+    valid = cols[None, :] < counts[:, None]
+    nearby = valid & (np.abs(ts - anomaly_time) < window)
+    nearby_counts = nearby.sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        recent_mean = np.where(nearby, val, 0.0).sum(axis=1) / nearby_counts
+        overall_mean = np.where(valid, val, 0.0).sum(axis=1) / counts
+        change_pct = np.where(
+            overall_mean != 0,
+            np.abs((recent_mean - overall_mean) / overall_mean * 100),
+            0.0
+        )
+
+    hits = (counts >= 10) & (nearby_counts >= 3) & (change_pct > min_change_pct)
+    idxs = np.nonzero(hits)[0]
+    return idxs, change_pct[idxs]
+
+# Emoji per severity level (module-level so it isn't rebuilt per message)
+SEVERITY_EMOJI = {
+    "low": "🟡",
+    "medium": "🟠",
+    "high": "🔴",
+    "critical": "🚨"
+}
+
+# Human-readable sensor names
+SENSOR_NAMES = {
+    "crypto": "₿ Cryptocurrency",
+    "network": "🌐 Network",
+    "time_drift": "⏰ Time",
+    "news": "📰 News",
+    "blockchain": "⛓️ Blockchain",
+    "weather": "🌤️ Weather",
+    "random": "🎲 Randomness"
+}
+
+
+@dataclass(slots=True)
+class Correlation:
+    """A parameter that moved together with an anomaly."""
+    parameter: str
+    change_percent: float
+    description: str
+    correlation: float = 0.0
+
+
+@dataclass(slots=True)
+class Precursor:
+    """An earlier anomaly that preceded the current one."""
+    parameter: str
+    time_before_seconds: float
+    z_score: float
+    description: str
+
 
 @dataclass
 class SmartInsight:
@@ -24,33 +102,14 @@ class SmartInsight:
     anomaly: AnomalyEvent
     explanation: str
     possible_causes: list[str]
-    correlations: list[dict[str, Any]]
-    precursors: list[dict[str, Any]]
+    correlations: list[Correlation]
+    precursors: list[Precursor]
     severity_level: str  # "low", "medium", "high", "critical"
     
     def to_telegram_message(self) -> str:
         """Generate human-readable Telegram message."""
-        # Emoji based on severity
-        emoji_map = {
-            "low": "🟡",
-            "medium": "🟠", 
-            "high": "🔴",
-            "critical": "🚨"
-        }
-        emoji = emoji_map.get(self.severity_level, "🔴")
-        
-        # Sensor name mapping
-        sensor_names = {
-            "crypto": "₿ Cryptocurrency",
-            "network": "🌐 Network",
-            "time_drift": "⏰ Time",
-            "news": "📰 News",
-            "blockchain": "⛓️ Blockchain",
-            "weather": "🌤️ Weather",
-            "random": "🎲 Randomness"
-        }
-
-        sensor_name = sensor_names.get(self.anomaly.sensor_source, self.anomaly.sensor_source)
+        emoji = SEVERITY_EMOJI.get(self.severity_level, "🔴")
+        sensor_name = SENSOR_NAMES.get(self.anomaly.sensor_source, self.anomaly.sensor_source)
 
         msg = f"{emoji} <b>ANOMALY: {sensor_name}</b>\n\n"
         msg += f"📊 <b>What happened:</b>\n{self.explanation}\n\n"
@@ -64,13 +123,13 @@ class SmartInsight:
         if self.correlations:
             msg += f"🔗 <b>Related events:</b>\n"
             for corr in self.correlations[:3]:
-                msg += f"• {corr['description']}\n"
+                msg += f"• {corr.description}\n"
             msg += "\n"
 
         if self.precursors:
             msg += f"⏱️ <b>Precursors (within 60 sec):</b>\n"
             for prec in self.precursors[:3]:
-                msg += f"• {prec['description']}\n"
+                msg += f"• {prec.description}\n"
             msg += "\n"
         elif not self.correlations:
             msg += f"⏱️ <b>Precursors:</b> None detected\n\n"
@@ -107,10 +166,32 @@ class SmartAnalyzer:
         # Store recent events for analysis
         self._recent_events: deque = deque(maxlen=1000)
         self._recent_anomalies: deque = deque(maxlen=100)
-        
-        # Parameter history for correlation
-        self._parameter_history: dict[str, deque] = {}
-    
+
+        # Parameter history as struct-of-arrays ring buffers.
+        # (source, key) -> row index into the ring arrays; the f-string
+        # param_key is built once at registration, not per event.
+        self._param_index: dict[tuple[str, str], int] = {}
+        self._param_keys: list[str] = []
+        self._ring_ts = np.empty((0, HISTORY_LEN))
+        self._ring_val = np.empty((0, HISTORY_LEN))
+        self._ring_head = np.empty(0, dtype=np.int64)
+        self._ring_count = np.empty(0, dtype=np.int64)
+
+    def _register_param(self, source: str, key: str) -> int:
+        """Assign a ring-buffer row to a new (source, key) parameter."""
+        idx = len(self._param_keys)
+        self._param_index[(source, key)] = idx
+        self._param_keys.append(f"{source}.{key}")
+
+        if idx >= self._ring_ts.shape[0]:
+            grow = max(16, self._ring_ts.shape[0])
+            self._ring_ts = np.vstack([self._ring_ts, np.zeros((grow, HISTORY_LEN))])
+            self._ring_val = np.vstack([self._ring_val, np.zeros((grow, HISTORY_LEN))])
+            self._ring_head = np.concatenate([self._ring_head, np.zeros(grow, dtype=np.int64)])
+            self._ring_count = np.concatenate([self._ring_count, np.zeros(grow, dtype=np.int64)])
+
+        return idx
+
     def record_event(self, event: Event) -> None:
         """Record an event for future analysis."""
         self._recent_events.append({
@@ -118,27 +199,23 @@ class SmartAnalyzer:
             "source": event.source,
             "payload": event.payload
         })
-        
+
         # Track numeric parameters
         for key, value in event.payload.items():
             if isinstance(value, (int, float)):
-                param_key = f"{event.source}.{key}"
-                if param_key not in self._parameter_history:
-                    self._parameter_history[param_key] = deque(maxlen=200)
-                self._parameter_history[param_key].append({
-                    "timestamp": event.timestamp,
-                    "value": float(value)
-                })
+                idx = self._param_index.get((event.source, key))
+                if idx is None:
+                    idx = self._register_param(event.source, key)
+                head = self._ring_head[idx]
+                self._ring_ts[idx, head] = event.timestamp
+                self._ring_val[idx, head] = value
+                self._ring_head[idx] = (head + 1) % HISTORY_LEN
+                if self._ring_count[idx] < HISTORY_LEN:
+                    self._ring_count[idx] += 1
     
     def record_anomaly(self, anomaly: AnomalyEvent) -> None:
         """Record an anomaly."""
-        self._recent_anomalies.append({
-            "timestamp": anomaly.timestamp,
-            "source": anomaly.sensor_source,
-            "parameter": anomaly.parameter,
-            "value": anomaly.value,
-            "z_score": anomaly.z_score
-        })
+        self._recent_anomalies.append(anomaly)
     
     def analyze(self, anomaly: AnomalyEvent) -> SmartInsight:
         """Analyze anomaly and generate insights."""
@@ -173,16 +250,17 @@ class SmartAnalyzer:
             return anomaly.metadata["reason"]
         
         source = anomaly.sensor_source
-        param = anomaly.parameter.split(".")[-1]  # Get last part
+        param = anomaly.parameter.rpartition(".")[2]  # Get last part
         value = anomaly.value
         z = anomaly.z_score
         mean = anomaly.mean
         
         direction = "above" if z > 0 else "below"
-        change_pct = abs((value - mean) / mean * 100) if mean != 0 else 0
 
-        # Source-specific explanations
+        # Source-specific explanations; change_pct is only computed by the
+        # branches that actually format a percentage
         if source == "crypto":
+            change_pct = abs((value - mean) / mean * 100) if mean != 0 else 0
             if "price" in param.lower():
                 return f"Cryptocurrency price changed sharply: {value:.2f} ({direction} average by {change_pct:.1f}%)"
             elif "volume" in param.lower():
@@ -190,6 +268,7 @@ class SmartAnalyzer:
 
         elif source == "network":
             if "latency" in param.lower() or "ping" in param.lower():
+                change_pct = abs((value - mean) / mean * 100) if mean != 0 else 0
                 return f"Network latency: {value:.1f}ms ({direction} average by {change_pct:.1f}%)"
             elif "packet_loss" in param.lower():
                 return f"Packet loss: {value:.1f}% (anomalously high)"
@@ -206,6 +285,7 @@ class SmartAnalyzer:
 
         elif source == "weather":
             if "temperature" in param.lower():
+                change_pct = abs((value - mean) / mean * 100) if mean != 0 else 0
                 return f"Temperature: {value:.1f}°C ({direction} average by {change_pct:.1f}%)"
             elif "pressure" in param.lower():
                 return f"Pressure: {value:.1f} hPa (sharp change)"
@@ -282,54 +362,117 @@ class SmartAnalyzer:
         
         return causes
     
-    def _detect_correlations(self, anomaly: AnomalyEvent) -> list[dict[str, Any]]:
-        """Detect correlations with other parameters at same time."""
+    def _detect_correlations(self, anomaly: AnomalyEvent) -> list[Correlation]:
+        """Detect parameters correlated with the anomalous one.
+
+        Computes real Pearson correlation between the anomaly's parameter
+        and each peer over the lookback window, honoring
+        self.correlation_threshold. Falls back to a percentage-delta scan
+        when the anomaly parameter has no tracked history.
+        """
         correlations = []
         anomaly_time = anomaly.timestamp
-        time_window = 10.0  # seconds
-        
-        # Find events near anomaly time
-        for param_key, history in self._parameter_history.items():
-            if param_key == anomaly.parameter:
+
+        source, _, key = anomaly.parameter.partition(".")
+        target_idx = self._param_index.get((source, key))
+
+        target = None
+        if target_idx is not None:
+            n_t = self._ring_count[target_idx]
+            if n_t >= 5:
+                t_ts = self._ring_ts[target_idx, :n_t]
+                t_val = self._ring_val[target_idx, :n_t]
+                in_window = np.abs(t_ts - anomaly_time) <= self.lookback_seconds
+                if in_window.sum() >= 5:
+                    order = np.argsort(t_ts[in_window])
+                    target = (t_ts[in_window][order], t_val[in_window][order])
+
+        if target is None:
+            return self._detect_correlations_by_delta(anomaly)
+
+        t_ts, t_val = target
+        for idx, param_key in enumerate(self._param_keys):
+            if idx == target_idx:
                 continue
-            
-            # Get values near anomaly time
-            nearby_values = [
-                h["value"] for h in history
-                if abs(h["timestamp"] - anomaly_time) < time_window
-            ]
-            
-            if len(nearby_values) < 3:
+
+            count = self._ring_count[idx]
+            if count < 10:
                 continue
-            
-            # Check if this parameter also changed significantly
-            recent_mean = sum(nearby_values) / len(nearby_values)
-            all_values = [h["value"] for h in history]
-            
-            if len(all_values) < 10:
+
+            ts = self._ring_ts[idx, :count]
+            values = self._ring_val[idx, :count]
+            in_window = np.abs(ts - anomaly_time) <= self.lookback_seconds
+            if in_window.sum() < 5:
                 continue
-            
-            overall_mean = sum(all_values) / len(all_values)
-            
-            # Calculate change
-            change_pct = abs((recent_mean - overall_mean) / overall_mean * 100) if overall_mean != 0 else 0
-            
-            if change_pct > 5:  # 5% change
-                source = param_key.split(".")[0]
-                param_name = param_key.split(".")[-1]
-                
-                correlations.append({
-                    "parameter": param_key,
-                    "change_percent": change_pct,
-                    "description": f"{source}: {param_name} changed by {change_pct:.1f}%"
-                })
-        
+
+            p_ts = ts[in_window]
+            p_val = values[in_window]
+
+            # Align the target series onto the peer's sample times
+            aligned = np.interp(p_ts, t_ts, t_val)
+            if p_val.std() == 0 or aligned.std() == 0:
+                continue
+
+            r = float(np.corrcoef(aligned, p_val)[0, 1])
+            if abs(r) < self.correlation_threshold:
+                continue
+
+            overall_mean = values.mean()
+            change_pct = abs((p_val.mean() - overall_mean) / overall_mean * 100) if overall_mean != 0 else 0
+
+            peer_source = param_key.partition(".")[0]
+            param_name = param_key.rpartition(".")[2]
+
+            correlations.append(Correlation(
+                parameter=param_key,
+                change_percent=float(change_pct),
+                description=f"{peer_source}: {param_name} correlated (r={r:.2f}, changed by {change_pct:.1f}%)",
+                correlation=r
+            ))
+
+        # Sort by correlation strength
+        correlations.sort(key=lambda x: abs(x.correlation), reverse=True)
+
+        return correlations
+
+    def _detect_correlations_by_delta(self, anomaly: AnomalyEvent) -> list[Correlation]:
+        """Percentage-delta fallback when the anomaly parameter is untracked."""
+        correlations = []
+        anomaly_time = anomaly.timestamp
+        time_window = 10.0  # seconds
+
+        # One vectorized sweep over all parameter rings; descriptions are
+        # only formatted for the hits.
+        n_params = len(self._param_keys)
+        idxs, change_pcts = _scan_correlations(
+            self._ring_ts[:n_params],
+            self._ring_val[:n_params],
+            self._ring_count[:n_params],
+            anomaly_time,
+            time_window,
+            min_change_pct=5.0
+        )
+
+        for idx, change_pct in zip(idxs, change_pcts):
+            param_key = self._param_keys[idx]
+            if param_key == anomaly.parameter:
+                continue
+
+            source = param_key.partition(".")[0]
+            param_name = param_key.rpartition(".")[2]
+
+            correlations.append(Correlation(
+                parameter=param_key,
+                change_percent=float(change_pct),
+                description=f"{source}: {param_name} changed by {change_pct:.1f}%"
+            ))
+
         # Sort by change magnitude
-        correlations.sort(key=lambda x: x["change_percent"], reverse=True)
-        
+        correlations.sort(key=lambda x: x.change_percent, reverse=True)
+
         return correlations
     
-    def _find_precursors(self, anomaly: AnomalyEvent) -> list[dict[str, Any]]:
+    def _find_precursors(self, anomaly: AnomalyEvent) -> list[Precursor]:
         """Find events that preceded the anomaly."""
         precursors = []
         anomaly_time = anomaly.timestamp
@@ -337,32 +480,32 @@ class SmartAnalyzer:
         
         # Look for anomalies in the lookback window
         for past_anomaly in self._recent_anomalies:
-            if past_anomaly["timestamp"] < lookback_start:
+            if past_anomaly.timestamp < lookback_start:
                 continue
-            if past_anomaly["timestamp"] >= anomaly_time:
+            if past_anomaly.timestamp >= anomaly_time:
                 continue
-            if past_anomaly["parameter"] == anomaly.parameter:
+            if past_anomaly.parameter == anomaly.parameter:
                 continue
-            
-            time_before = anomaly_time - past_anomaly["timestamp"]
-            
-            precursors.append({
-                "parameter": past_anomaly["parameter"],
-                "time_before_seconds": time_before,
-                "z_score": past_anomaly["z_score"],
-                "description": f"{past_anomaly['source']}: anomaly {int(time_before)}s before"
-            })
-        
+
+            time_before = anomaly_time - past_anomaly.timestamp
+
+            precursors.append(Precursor(
+                parameter=past_anomaly.parameter,
+                time_before_seconds=time_before,
+                z_score=past_anomaly.z_score,
+                description=f"{past_anomaly.sensor_source}: anomaly {int(time_before)}s before"
+            ))
+
         # Sort by time (most recent first)
-        precursors.sort(key=lambda x: x["time_before_seconds"])
+        precursors.sort(key=lambda x: x.time_before_seconds)
         
         return precursors
     
     def _determine_severity(
         self,
         anomaly: AnomalyEvent,
-        correlations: list[dict],
-        precursors: list[dict]
+        correlations: list[Correlation],
+        precursors: list[Precursor]
     ) -> str:
         """Determine severity level."""
         z = abs(anomaly.z_score)
@@ -6,20 +6,70 @@ instead of statistical z-scores. More suitable for real-world data.
 All thresholds are logged for future calibration.
 """
 
+import json
 import logging
+import math
+import re
+import sys
 import time
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from ...core.types import Event, EventType, AnomalyEvent
 from ...core.event_bus import EventBus
 from ...monitoring.calibration_tracker import get_tracker
+from ._threshold_kernel import (
+    CHECK_CHANGE,
+    CHECK_MAX,
+    CHECK_MIN,
+    CHECK_TRIGGER,
+    check as kernel_check,
+)
 
 logger = logging.getLogger(__name__)
 
+# Screen-cache sentinel: key needs the per-rule Python path
+_PYTHON_PATH = object()
+
+# z_score equivalents per severity (compatibility with z-score consumers)
+_Z_SCORE = {"low": 5.0, "medium": 7.0, "high": 10.0, "critical": 15.0}
+
+# Severity buckets indexed by how many ratio thresholds were cleared
+_SEVERITY_BUCKETS = ("low", "medium", "high", "critical")
+
+# Per-parameter history ring: fixed NumPy columns with amortized
+# compaction instead of a deque of per-sample objects
+_HIST_MAXLEN = 1000
+_HIST_CAPACITY = 2 * _HIST_MAXLEN
+
+
+def _history_new() -> list:
+    """Fresh history buffer: [timestamps, values, length]."""
+    return [np.empty(_HIST_CAPACITY), np.empty(_HIST_CAPACITY), 0]
+
 
-@dataclass
+def _history_append(buf: list, timestamp: float, value: float) -> None:
+    """Append one sample, compacting to the last _HIST_MAXLEN when full."""
+    length = buf[2]
+    if length == _HIST_CAPACITY:
+        buf[0][:_HIST_MAXLEN] = buf[0][_HIST_MAXLEN:]
+        buf[1][:_HIST_MAXLEN] = buf[1][_HIST_MAXLEN:]
+        length = _HIST_MAXLEN
+    buf[0][length] = timestamp
+    buf[1][length] = value
+    buf[2] = length + 1
+
+
+@dataclass(slots=True, frozen=True)
 class ThresholdRule:
     """Rule for detecting anomalies in a parameter."""
     parameter_pattern: str  # e.g., "crypto.*price"
@@ -29,6 +79,39 @@ class ThresholdRule:
     trigger_when_above: float | None = None  # Trigger when value >= this (opposite of min_absolute_value)
     lookback_seconds: float = 60.0  # How far back to compare
     description: str = ""
+    _match_kind: str = field(init=False, repr=False, compare=False)
+    _prefix: str = field(init=False, repr=False, compare=False)
+    _suffix: str = field(init=False, repr=False, compare=False)
+    _compiled: re.Pattern | None = field(init=False, repr=False, compare=False)
+    # NaN-sentinel mirrors of the optional thresholds, kernel-ready
+    _max_abs: float = field(init=False, repr=False, compare=False)
+    _min_abs: float = field(init=False, repr=False, compare=False)
+    _trig: float = field(init=False, repr=False, compare=False)
+    _min_pct: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields go through object.__setattr__
+        set_ = object.__setattr__
+        set_(self, "_max_abs", math.nan if self.max_absolute_value is None else float(self.max_absolute_value))
+        set_(self, "_min_abs", math.nan if self.min_absolute_value is None else float(self.min_absolute_value))
+        set_(self, "_trig", math.nan if self.trigger_when_above is None else float(self.trigger_when_above))
+        set_(self, "_min_pct", math.nan if self.min_change_percent is None else float(self.min_change_percent))
+        # Classify the pattern once; every pattern in practice is a literal,
+        # "prefix*", "*suffix" or "prefix*suffix", so plain string
+        # comparisons replace the regex engine in the hot path.
+        parts = self.parameter_pattern.split("*")
+        set_(self, "_prefix", parts[0])
+        set_(self, "_suffix", parts[-1])
+        set_(self, "_compiled", None)
+        if len(parts) == 1:
+            set_(self, "_match_kind", "exact")
+        elif len(parts) == 2:
+            set_(self, "_match_kind", "affix")
+        else:
+            # Multiple wildcards: fall back to a precompiled regex
+            set_(self, "_match_kind", "regex")
+            regex_pattern = self.parameter_pattern.replace(".", r"\.").replace("*", ".*")
+            set_(self, "_compiled", re.compile(f"^{regex_pattern}$"))
 
 
 class ThresholdDetector:
@@ -38,23 +121,53 @@ class ThresholdDetector:
     what constitutes a real anomaly.
     """
     
-    def __init__(self, event_bus: EventBus | None = None, enable_calibration_tracking: bool = True):
+    def __init__(
+        self,
+        event_bus: EventBus | None = None,
+        enable_calibration_tracking: bool = True,
+        log_sample_every: int = 16
+    ):
         """Initialize threshold detector.
-        
+
         Args:
             event_bus: Event bus for publishing anomalies
             enable_calibration_tracking: Whether to log threshold checks for calibration
+            log_sample_every: Log every N-th value/non-triggered check for calibration
         """
         self.event_bus = event_bus
-        self._history: dict[str, deque] = {}
+        self._history: dict[str, list] = {}
         self._anomaly_count = 0
         self._enable_calibration_tracking = enable_calibration_tracking
+
+        # Calibration logging is sampled: triggered checks always log,
+        # everything else logs one sample in log_sample_every
+        self._log_sample_every = max(1, log_sample_every)
+        self._log_counters: dict[str, int] = {}
         
-        # Load calibrated thresholds first
+        # Define rules for different sensors; calibrated thresholds are
+        # read once here since the default rules consume them
         self._calibrated_thresholds = self._load_calibrated_thresholds()
-        
-        # Define rules for different sensors (with calibrated values applied)
         self._rules = self._create_default_rules()
+
+        # Inverted index: source token -> rules anchored on it ("" holds
+        # rules whose leading token is wildcarded). process() only scans
+        # the bucket for the event's source instead of every rule.
+        self._rules_by_source: dict[str, list[ThresholdRule]] = {}
+        for rule in self._rules:
+            self._index_rule(rule)
+
+        # Memoized param_key -> matching rules; keys recur on every tick,
+        # so pattern resolution runs once per distinct key
+        self._rule_cache: dict[str, tuple[ThresholdRule, ...]] = {}
+
+        # param_key -> (max, min, trigger) screen bounds for keys whose
+        # single matching rule has only absolute thresholds, or
+        # _PYTHON_PATH when the key needs the full per-rule path
+        self._screen_cache: dict[str, Any] = {}
+
+        # (source, payload key) -> interned "source.key" string, so the
+        # hot loop neither formats nor re-hashes param keys
+        self._param_key_cache: dict[tuple[str, str], str] = {}
         
         # Get calibration tracker
         if self._enable_calibration_tracking:
@@ -64,14 +177,10 @@ class ThresholdDetector:
     
     def _load_calibrated_thresholds(self) -> dict:
         """Load calibrated thresholds from file."""
-        import json
-        from pathlib import Path
-        
         calibrated_file = Path("logs/calibration/calibrated_thresholds.json")
         if calibrated_file.exists():
             try:
-                with open(calibrated_file, "r") as f:
-                    data = json.load(f)
+                data = _json_loads(calibrated_file.read_bytes())
                 logger.info(f"Loaded {len(data)} calibrated thresholds")
                 return data
             except Exception as e:
@@ -220,9 +329,27 @@ class ThresholdDetector:
             ),
         ]
     
+    def _should_sample_log(self, name: str) -> bool:
+        """True for one call in every log_sample_every per counter name."""
+        count = self._log_counters.get(name, 0)
+        self._log_counters[name] = count + 1
+        return count % self._log_sample_every == 0
+
+    def _index_rule(self, rule: ThresholdRule) -> None:
+        """File a rule under the static source token of its pattern."""
+        token = rule.parameter_pattern.partition(".")[0]
+        if "*" in token:
+            token = ""
+        self._rules_by_source.setdefault(token, []).append(rule)
+
     def add_rule(self, rule: ThresholdRule) -> None:
         """Add a custom detection rule."""
         self._rules.append(rule)
+        self._index_rule(rule)
+        self._rule_cache.clear()
+        # Screen bounds are derived from the matching rules, so cached
+        # entries may no longer cover the new rule's checks
+        self._screen_cache.clear()
     
     def process(self, event: Event) -> list[AnomalyEvent]:
         """Process an event and detect anomalies.
@@ -233,43 +360,180 @@ class ThresholdDetector:
         Returns:
             List of detected anomalies
         """
-        anomalies = []
-        
-        for key, value in event.payload.items():
-            if not isinstance(value, (int, float)) or value is None:
-                continue
-            
-            param_key = f"{event.source}.{key}"
-            
-            # Log value for distribution analysis
-            if self._tracker:
-                self._tracker.log_value_distribution(
-                    parameter_name=param_key,
-                    value=float(value),
-                    metadata={"source": event.source, "timestamp": event.timestamp}
-                )
-            
-            # Check all matching rules
-            for rule in self._rules:
-                if self._matches_pattern(param_key, rule.parameter_pattern):
-                    anomaly = self._check_rule(
-                        param_key=param_key,
-                        value=float(value),
-                        rule=rule,
-                        timestamp=event.timestamp,
-                        source=event.source
+        return self.process_batch((event,))
+
+    def process_batch(self, events: "tuple[Event, ...] | list[Event]") -> list[AnomalyEvent]:
+        """Process a burst of events, amortizing the screen sweep.
+
+        Events must be in timestamp order (per parameter). All screenable
+        keys across the whole burst go through one vectorized
+        absolute-threshold sweep instead of one per event.
+
+        Args:
+            events: Events to process, oldest first
+
+        Returns:
+            List of detected anomalies across the burst
+        """
+        anomalies: list[AnomalyEvent] = []
+
+        # Vectorized screening is only used when calibration logging is
+        # off; the tracker path needs per-check bookkeeping
+        if self._tracker is None:
+            screen_keys: list[str] | None = []
+            screen_values: list[float] = []
+            screen_bounds: list[tuple[float, float, float]] = []
+            screen_ts: list[float] = []
+            screen_sources: list[str] = []
+        else:
+            screen_keys = None
+
+        for event in events:
+            # Only rules anchored on this event's source (plus any with a
+            # wildcarded leading token) can match its parameters
+            candidate_rules = self._rules_by_source.get(event.source, [])
+            generic_rules = self._rules_by_source.get("")
+            if generic_rules:
+                candidate_rules = candidate_rules + generic_rules
+
+            # The event's numeric projection is computed once and shared by
+            # every consumer, so no per-detector type checking remains here
+            for key, fvalue in event.numeric_items():
+                param_key = self._param_key_cache.get((event.source, key))
+                if param_key is None:
+                    param_key = sys.intern(f"{event.source}.{key}")
+                    self._param_key_cache[(event.source, key)] = param_key
+
+                # Log value for distribution analysis (sampled)
+                if self._tracker and self._should_sample_log(param_key):
+                    self._tracker.log_value_distribution(
+                        parameter_name=param_key,
+                        value=fvalue,
+                        metadata={"source": event.source, "timestamp": event.timestamp}
                     )
-                    if anomaly:
-                        anomalies.append(anomaly)
-                        break  # Only one anomaly per parameter
-        
+
+                # Check all matching rules (resolved once per distinct key)
+                matching_rules = self._rule_cache.get(param_key)
+                if matching_rules is None:
+                    matching_rules = tuple(
+                        rule for rule in candidate_rules
+                        if self._matches_pattern(param_key, rule)
+                    )
+                    self._rule_cache[param_key] = matching_rules
+
+                if not matching_rules:
+                    continue
+
+                # Without calibration logging, absolute-only keys can be
+                # screened in one vectorized sweep below
+                if screen_keys is not None:
+                    screen = self._screen_cache.get(param_key)
+                    if screen is None:
+                        screen = self._build_screen(matching_rules)
+                        self._screen_cache[param_key] = screen
+                    if screen is not _PYTHON_PATH:
+                        screen_keys.append(param_key)
+                        screen_values.append(fvalue)
+                        screen_bounds.append(screen)
+                        screen_ts.append(event.timestamp)
+                        screen_sources.append(event.source)
+                        continue
+
+                self._check_key_rules(
+                    param_key, fvalue, matching_rules, event.timestamp, event.source, anomalies
+                )
+
+        if screen_keys:
+            self._screen_batch(
+                screen_keys, screen_values, screen_bounds,
+                screen_ts, screen_sources, anomalies
+            )
+
         return anomalies
+
+    def _check_key_rules(
+        self,
+        param_key: str,
+        value: float,
+        matching_rules: tuple[ThresholdRule, ...],
+        timestamp: float,
+        source: str,
+        anomalies: list[AnomalyEvent]
+    ) -> None:
+        """Run the full per-rule check path for one parameter."""
+        for rule in matching_rules:
+            anomaly = self._check_rule(
+                param_key=param_key,
+                value=value,
+                rule=rule,
+                timestamp=timestamp,
+                source=source
+            )
+            if anomaly:
+                anomalies.append(anomaly)
+                break  # Only one anomaly per parameter
+
+    @staticmethod
+    def _build_screen(matching_rules: tuple[ThresholdRule, ...]) -> Any:
+        """Screen bounds for a key, or _PYTHON_PATH if it can't be screened."""
+        if len(matching_rules) != 1:
+            return _PYTHON_PATH
+        rule = matching_rules[0]
+        if rule.min_change_percent is not None:
+            return _PYTHON_PATH
+        return (
+            math.inf if rule.max_absolute_value is None else rule.max_absolute_value,
+            -math.inf if rule.min_absolute_value is None else rule.min_absolute_value,
+            math.inf if rule.trigger_when_above is None else rule.trigger_when_above,
+        )
+
+    def _screen_batch(
+        self,
+        keys: list[str],
+        values: list[float],
+        bounds: list[tuple[float, float, float]],
+        timestamps: list[float],
+        sources: list[str],
+        anomalies: list[AnomalyEvent]
+    ) -> None:
+        """Vectorized absolute-threshold sweep over the collected keys.
+
+        Keys that cannot fire only record history; the per-rule path runs
+        just for the positions the sweep flags. Positions are handled in
+        input order, keeping per-parameter history chronological.
+        """
+        vals = np.array(values)
+        bounds_arr = np.array(bounds)
+        fired = (
+            (vals > bounds_arr[:, 0])
+            | (vals < bounds_arr[:, 1])
+            | (vals >= bounds_arr[:, 2])
+        )
+
+        for i, param_key in enumerate(keys):
+            if fired[i]:
+                self._check_key_rules(
+                    param_key, values[i], self._rule_cache[param_key],
+                    timestamps[i], sources[i], anomalies
+                )
+            else:
+                buf = self._history.get(param_key)
+                if buf is None:
+                    buf = self._history[param_key] = _history_new()
+                _history_append(buf, timestamps[i], values[i])
     
-    def _matches_pattern(self, param_key: str, pattern: str) -> bool:
-        """Check if parameter matches pattern (supports wildcards)."""
-        import re
-        regex_pattern = pattern.replace(".", r"\.").replace("*", ".*")
-        return bool(re.match(f"^{regex_pattern}$", param_key))
+    def _matches_pattern(self, param_key: str, rule: ThresholdRule) -> bool:
+        """Check if parameter matches the rule's pattern (supports wildcards)."""
+        kind = rule._match_kind
+        if kind == "exact":
+            return param_key == rule.parameter_pattern
+        if kind == "affix":
+            return (
+                param_key.startswith(rule._prefix)
+                and param_key.endswith(rule._suffix)
+                and len(param_key) >= len(rule._prefix) + len(rule._suffix)
+            )
+        return rule._compiled.match(param_key) is not None
     
     def _check_rule(
         self,
@@ -280,134 +544,139 @@ class ThresholdDetector:
         source: str
     ) -> AnomalyEvent | None:
         """Check if value violates a rule."""
-        # Store value in history
-        if param_key not in self._history:
-            self._history[param_key] = deque(maxlen=1000)
-        
-        self._history[param_key].append({
-            "timestamp": timestamp,
-            "value": value
-        })
-        
-        history = self._history[param_key]
-        
-        # Check absolute thresholds (work on first value)
-        if rule.max_absolute_value is not None:
-            triggered = value > rule.max_absolute_value
-            
-            # Log for calibration
-            if self._tracker:
-                self._tracker.log_threshold_check(
-                    threshold_name=f"{param_key}.max",
-                    value=value,
-                    threshold_value=rule.max_absolute_value,
-                    triggered=triggered,
-                    metadata={"rule": rule.description, "source": source}
-                )
-            
-            if triggered:
-                return self._create_anomaly(
-                    param_key=param_key,
-                    value=value,
-                    timestamp=timestamp,
-                    source=source,
-                    reason=f"Threshold exceeded: {value:.2f} > {rule.max_absolute_value:.2f}",
-                    rule_description=rule.description,
-                    severity="high"
-                )
-        
-        if rule.min_absolute_value is not None:
-            triggered = value < rule.min_absolute_value
-            
-            # Log for calibration
-            if self._tracker:
-                self._tracker.log_threshold_check(
-                    threshold_name=f"{param_key}.min",
-                    value=value,
-                    threshold_value=rule.min_absolute_value,
-                    triggered=triggered,
-                    metadata={"rule": rule.description, "source": source}
-                )
-            
-            if triggered:
-                return self._create_anomaly(
-                    param_key=param_key,
-                    value=value,
-                    timestamp=timestamp,
-                    source=source,
-                    reason=f"Below threshold: {value:.2f} < {rule.min_absolute_value:.2f}",
-                    rule_description=rule.description,
-                    severity="high"
+        # Store value in the parameter's history ring
+        buf = self._history.get(param_key)
+        if buf is None:
+            buf = self._history[param_key] = _history_new()
+
+        _history_append(buf, timestamp, value)
+
+        # Cheap absolute checks first; the lookback scan only runs when
+        # none of them fire and the rule actually has a change threshold
+        old_value = math.nan
+        code, change_pct = kernel_check(
+            value,
+            old_value,
+            rule._max_abs,
+            rule._min_abs,
+            rule._trig,
+            rule._min_pct
+        )
+
+        if code == 0 and not math.isnan(rule._min_pct):
+            ts_buf, val_buf, length = buf
+            start = max(0, length - _HIST_MAXLEN)
+            if length - start >= 2:
+                # Timestamps are monotonic, so binary-search straight to
+                # the first in-window sample
+                lookback_time = timestamp - rule.lookback_seconds
+                idx = start + np.searchsorted(ts_buf[start:length], lookback_time)
+                if length - idx >= 2:
+                    old_value = float(val_buf[idx])
+                code, change_pct = kernel_check(
+                    value,
+                    old_value,
+                    rule._max_abs,
+                    rule._min_abs,
+                    rule._trig,
+                    rule._min_pct
                 )
-        
-        if rule.trigger_when_above is not None:
-            triggered = value >= rule.trigger_when_above
-            
-            # Log for calibration
-            if self._tracker:
+
+        if self._tracker:
+            self._log_rule_checks(param_key, value, old_value, rule, code, change_pct, source)
+
+        if code == CHECK_MAX:
+            return self._create_anomaly(
+                param_key=param_key,
+                value=value,
+                timestamp=timestamp,
+                source=source,
+                reason=f"Threshold exceeded: {value:.2f} > {rule._max_abs:.2f}",
+                rule_description=rule.description,
+                severity="high"
+            )
+
+        if code == CHECK_MIN:
+            return self._create_anomaly(
+                param_key=param_key,
+                value=value,
+                timestamp=timestamp,
+                source=source,
+                reason=f"Below threshold: {value:.2f} < {rule._min_abs:.2f}",
+                rule_description=rule.description,
+                severity="high"
+            )
+
+        if code == CHECK_TRIGGER:
+            return self._create_anomaly(
+                param_key=param_key,
+                value=value,
+                timestamp=timestamp,
+                source=source,
+                reason=f"Detected: {value:.2f} >= {rule._trig:.2f}",
+                rule_description=rule.description,
+                severity="high"
+            )
+
+        if code == CHECK_CHANGE:
+            direction = "increased" if value > old_value else "decreased"
+            return self._create_anomaly(
+                param_key=param_key,
+                value=value,
+                timestamp=timestamp,
+                source=source,
+                reason=f"Value {direction} by {change_pct:.1f}% in {rule.lookback_seconds:.0f}s (was {old_value:.2f})",
+                rule_description=rule.description,
+                severity=self._calculate_severity(change_pct, rule._min_pct)
+            )
+
+        return None
+
+    def _log_rule_checks(
+        self,
+        param_key: str,
+        value: float,
+        old_value: float,
+        rule: ThresholdRule,
+        code: int,
+        change_pct: float,
+        source: str
+    ) -> None:
+        """Log the checks the kernel evaluated (non-triggered ones sampled).
+
+        The kernel evaluates checks in max/min/trigger/change order and
+        stops at the first hit, so every check before the fired one was
+        evaluated and did not trigger.
+        """
+        checks = (
+            (CHECK_MAX, "max", rule.max_absolute_value, value),
+            (CHECK_MIN, "min", rule.min_absolute_value, value),
+            (CHECK_TRIGGER, "trigger_above", rule.trigger_when_above, value),
+            (CHECK_CHANGE, "change_pct", rule.min_change_percent, change_pct),
+        )
+        for check_code, suffix, threshold, checked_value in checks:
+            if threshold is None:
+                continue
+            if check_code == CHECK_CHANGE and math.isnan(change_pct):
+                break  # Lookback sample unavailable; check never ran
+            triggered = code == check_code
+            # Log for calibration (non-triggered checks are sampled)
+            if triggered or self._should_sample_log(f"{param_key}.{suffix}"):
+                metadata: dict[str, Any] = {"rule": rule.description, "source": source}
+                if check_code == CHECK_CHANGE:
+                    metadata["lookback_seconds"] = rule.lookback_seconds
+                    metadata["old_value"] = old_value
+                    metadata["new_value"] = value
                 self._tracker.log_threshold_check(
-                    threshold_name=f"{param_key}.trigger_above",
-                    value=value,
-                    threshold_value=rule.trigger_when_above,
+                    threshold_name=f"{param_key}.{suffix}",
+                    value=checked_value,
+                    threshold_value=threshold,
                     triggered=triggered,
-                    metadata={"rule": rule.description, "source": source}
+                    metadata=metadata
                 )
-            
             if triggered:
-                return self._create_anomaly(
-                    param_key=param_key,
-                    value=value,
-                    timestamp=timestamp,
-                    source=source,
-                    reason=f"Detected: {value:.2f} >= {rule.trigger_when_above:.2f}",
-                    rule_description=rule.description,
-                    severity="high"
-                )
-        
-        # Check percentage change (needs at least 2 values)
-        if rule.min_change_percent is not None and len(history) >= 2:
-            # Find value from lookback period
-            lookback_time = timestamp - rule.lookback_seconds
-            old_values = [h for h in history if h["timestamp"] >= lookback_time]
-            
-            if len(old_values) >= 2:
-                old_value = old_values[0]["value"]
-                
-                # Calculate percentage change
-                if old_value != 0:
-                    change_pct = abs((value - old_value) / old_value * 100)
-                    triggered = change_pct >= rule.min_change_percent
-                    
-                    # Log for calibration
-                    if self._tracker:
-                        self._tracker.log_threshold_check(
-                            threshold_name=f"{param_key}.change_pct",
-                            value=change_pct,
-                            threshold_value=rule.min_change_percent,
-                            triggered=triggered,
-                            metadata={
-                                "rule": rule.description,
-                                "source": source,
-                                "lookback_seconds": rule.lookback_seconds,
-                                "old_value": old_value,
-                                "new_value": value
-                            }
-                        )
-                    
-                    if triggered:
-                        direction = "increased" if value > old_value else "decreased"
-                        return self._create_anomaly(
-                            param_key=param_key,
-                            value=value,
-                            timestamp=timestamp,
-                            source=source,
-                            reason=f"Value {direction} by {change_pct:.1f}% in {rule.lookback_seconds:.0f}s (was {old_value:.2f})",
-                            rule_description=rule.description,
-                            severity=self._calculate_severity(change_pct, rule.min_change_percent)
-                        )
-        
-        return None
-    
+                break
+
     def _create_anomaly(
         self,
         param_key: str,
@@ -422,8 +691,7 @@ class ThresholdDetector:
         self._anomaly_count += 1
         
         # Calculate z_score equivalent for compatibility (just use severity)
-        z_score_map = {"low": 5.0, "medium": 7.0, "high": 10.0, "critical": 15.0}
-        z_score = z_score_map.get(severity, 10.0)
+        z_score = _Z_SCORE.get(severity, 10.0)
         
         anomaly = AnomalyEvent(
             timestamp=timestamp,
@@ -444,22 +712,17 @@ class ThresholdDetector:
         if self.event_bus:
             self.event_bus.publish(anomaly.to_event())
         
-        logger.info(f"Anomaly detected: {rule_description} - {reason}")
+        # Lazy %-formatting: no string work when INFO is disabled
+        logger.info("Anomaly detected: %s - %s", rule_description, reason)
         
         return anomaly
     
     def _calculate_severity(self, change_pct: float, threshold: float) -> str:
         """Calculate severity based on how much threshold was exceeded."""
         ratio = change_pct / threshold
-        
-        if ratio >= 3.0:
-            return "critical"
-        elif ratio >= 2.0:
-            return "high"
-        elif ratio >= 1.5:
-            return "medium"
-        else:
-            return "low"
+
+        # Branchless bucket index: count the ratio thresholds cleared
+        return _SEVERITY_BUCKETS[(ratio >= 1.5) + (ratio >= 2.0) + (ratio >= 3.0)]
     
     def get_anomaly_count(self) -> int:
         """Get total anomaly count."""
@@ -467,6 +730,12 @@ class ThresholdDetector:
     
     def get_history(self, param_key: str) -> list[dict]:
         """Get history for a parameter."""
-        if param_key not in self._history:
+        buf = self._history.get(param_key)
+        if buf is None:
             return []
-        return list(self._history[param_key])
+        ts_buf, val_buf, length = buf
+        start = max(0, length - _HIST_MAXLEN)
+        return [
+            {"timestamp": float(ts), "value": float(value)}
+            for ts, value in zip(ts_buf[start:length], val_buf[start:length])
+        ]
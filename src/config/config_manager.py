@@ -8,17 +8,99 @@ import logging
 import os
 import threading
 import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 from .schema import Config, SensorConfig, StorageConfig, AnalysisConfig, AlertingConfig
 
+try:
+    import orjson
+
+    def _json_loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+try:
+    import fastjsonschema
+
+    _SCHEMA_PATH = Path(__file__).with_name("schema.json")
+    # Compiled once at import; emits straight-line Python per schema rule.
+    _validate_schema = fastjsonschema.compile(_json_loads(_SCHEMA_PATH.read_bytes()))
+except ImportError:
+    _validate_schema = None
+
+# Fallback validation rules, used when fastjsonschema is unavailable.
+# Each entry is a rule tuple dispatched on its first element:
+#   ("range", types, lo, hi, message)        - one combined type+range message
+#   ("number", lo, hi, type_msg, range_msg)  - type and range reported apart
+#   ("bool", message)
+#   ("enum", allowed, message)
+# Type tuples hoisted so isinstance checks in the validation loop reuse
+# one object instead of building a tuple per call.
+_NUM: tuple = (int, float)
+_INT: tuple = (int,)
+
+_SENSOR_RULES: dict[str, tuple] = {
+    "enabled": ("bool", "must be boolean"),
+    "interval_seconds": (
+        "number", 0.1, 3600, "must be a number", "must be between 0.1 and 3600"
+    ),
+    "priority": (
+        "enum", ("high", "medium", "low"), "must be 'high', 'medium', or 'low'"
+    ),
+}
+
+_SECTION_RULES: dict[str, dict[str, tuple]] = {
+    "storage": {
+        "max_file_size_mb": (
+            "range", _INT, 1, 10000, "must be integer between 1 and 10000"
+        ),
+        "buffer_size": (
+            "range", _INT, 1, 100000, "must be integer between 1 and 100000"
+        ),
+    },
+    "analysis": {
+        "window_size": (
+            "range", _INT, 10, 10000, "must be integer between 10 and 10000"
+        ),
+        "z_score_threshold": (
+            "range", _NUM, 1.0, 10.0, "must be number between 1.0 and 10.0"
+        ),
+    },
+    "alerting": {
+        "cooldown_seconds": (
+            "range", _INT, 0, 86400, "must be integer between 0 and 86400"
+        ),
+        "min_cluster_sensors": (
+            "range", _INT, 2, 10, "must be integer between 2 and 10"
+        ),
+    },
+}
+
+
 logger = logging.getLogger(__name__)
 
 
 class ConfigValidationError:
     """Represents a configuration validation error."""
-    
+
+    __slots__ = ("path", "message", "value")
+
     def __init__(self, path: str, message: str, value: Any = None):
         self.path = path
         self.message = message
@@ -30,6 +112,11 @@ class ConfigValidationError:
         return f"{self.path}: {self.message}"
 
 
+# Shared "no errors" result so the common valid-config path allocates
+# nothing.
+_EMPTY_ERRORS: tuple[ConfigValidationError, ...] = ()
+
+
 class ConfigManager:
     """Manages configuration loading, validation, and hot-reload.
     
@@ -48,11 +135,24 @@ class ConfigManager:
             config_path: Path to configuration file
         """
         self.config_path = Path(config_path)
+        # String forms cached once; the hot load/poll paths use these
+        # with os-level calls instead of Path methods.
+        self._config_path_str = os.fspath(self.config_path)
+        self._parent_dir = os.path.dirname(self._config_path_str) or "."
         self.config: Config = Config.default()
         self._lock = threading.RLock()
         self._last_modified: float = 0
-        self._reload_callbacks: list[Callable[[Config], None]] = []
-        self._validation_errors: list[ConfigValidationError] = []
+        # Immutable snapshot; on_reload replaces the whole tuple so
+        # reload() can iterate it lock-free.
+        self._reload_callbacks: tuple[Callable[[Config], None], ...] = ()
+        self._validation_errors: Sequence[ConfigValidationError] = _EMPTY_ERRORS
+        # (st_mtime_ns, st_size) of the file backing the current config;
+        # lets load() skip re-parsing when the file is unchanged.
+        self._cache_key: tuple[int, int] | None = None
+        # Bumped on every successful (re)parse; reload() compares this
+        # instead of deep-comparing Config objects.
+        self._version = 0
+        self._observer = None
     
     def load(self, path: str | None = None) -> Config:
         """Load configuration from file.
@@ -63,28 +163,38 @@ class ConfigManager:
         Returns:
             Loaded configuration object
         """
-        config_path = Path(path) if path else self.config_path
-        
+        config_path = os.fspath(path) if path else self._config_path_str
+        is_own_path = config_path == self._config_path_str
+
         with self._lock:
-            if not config_path.exists():
+            try:
+                stat = os.stat(config_path)
+            except FileNotFoundError:
                 logger.warning(f"Config file not found: {config_path}, creating default")
-                self.save_default(str(config_path))
+                self.save_default(config_path)
                 return self.config
-            
+
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            if cache_key == self._cache_key and is_own_path:
+                return self.config
+
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
+                with open(config_path, "rb") as f:
+                    data = _json_loads(f.read())
+
                 self._validation_errors = self.validate(data)
                 if self._validation_errors:
                     for error in self._validation_errors:
                         logger.warning(f"Config validation: {error}")
                 
                 self.config = Config.from_dict(data)
-                self._last_modified = config_path.stat().st_mtime
+                self._last_modified = stat.st_mtime
+                if is_own_path:
+                    self._cache_key = cache_key
+                self._version += 1
                 logger.info(f"Configuration loaded from {config_path}")
-                
-            except json.JSONDecodeError as e:
+
+            except ValueError as e:
                 logger.error(f"Invalid JSON in config file: {e}")
                 self._validation_errors = [
                     ConfigValidationError("", f"Invalid JSON: {e}")
@@ -102,7 +212,7 @@ class ConfigManager:
         
         return self.config
     
-    def validate(self, data: dict[str, Any]) -> list[ConfigValidationError]:
+    def validate(self, data: dict[str, Any]) -> Sequence[ConfigValidationError]:
         """Validate configuration data.
         
         Args:
@@ -111,162 +221,109 @@ class ConfigManager:
         Returns:
             List of validation errors (empty if valid)
         """
+        if _validate_schema is not None:
+            try:
+                _validate_schema(data)
+                return _EMPTY_ERRORS
+            except fastjsonschema.JsonSchemaException as e:
+                path = ".".join(str(p) for p in e.path[1:])
+                return [ConfigValidationError(path, e.message, getattr(e, "value", None))]
+
         errors: list[ConfigValidationError] = []
-        
-        # Validate sensors section
+
         if "sensors" in data:
-            if not isinstance(data["sensors"], dict):
+            sensors = data["sensors"]
+            if not isinstance(sensors, dict):
                 errors.append(ConfigValidationError(
-                    "sensors", "must be a dictionary", type(data["sensors"]).__name__
+                    "sensors", "must be a dictionary", type(sensors).__name__
                 ))
             else:
-                for name, sensor_data in data["sensors"].items():
-                    errors.extend(self._validate_sensor_config(f"sensors.{name}", sensor_data))
-        
-        # Validate storage section
-        if "storage" in data:
-            errors.extend(self._validate_storage_config("storage", data["storage"]))
-        
-        # Validate analysis section
-        if "analysis" in data:
-            errors.extend(self._validate_analysis_config("analysis", data["analysis"]))
-        
-        # Validate alerting section
-        if "alerting" in data:
-            errors.extend(self._validate_alerting_config("alerting", data["alerting"]))
-        
-        # Validate api_keys section
+                for name, sensor_data in sensors.items():
+                    self._check_section(f"sensors.{name}", sensor_data, _SENSOR_RULES, errors)
+
+        for section, rules in _SECTION_RULES.items():
+            if section in data:
+                self._check_section(section, data[section], rules, errors)
+
         if "api_keys" in data:
             if not isinstance(data["api_keys"], dict):
                 errors.append(ConfigValidationError(
                     "api_keys", "must be a dictionary", type(data["api_keys"]).__name__
                 ))
-        
-        return errors
-    
-    def _validate_sensor_config(self, path: str, data: Any) -> list[ConfigValidationError]:
-        """Validate sensor configuration."""
-        errors: list[ConfigValidationError] = []
-        
-        if not isinstance(data, dict):
-            errors.append(ConfigValidationError(path, "must be a dictionary", type(data).__name__))
-            return errors
-        
-        if "enabled" in data and not isinstance(data["enabled"], bool):
-            errors.append(ConfigValidationError(
-                f"{path}.enabled", "must be boolean", data["enabled"]
-            ))
-        
-        if "interval_seconds" in data:
-            val = data["interval_seconds"]
-            if not isinstance(val, (int, float)):
-                errors.append(ConfigValidationError(
-                    f"{path}.interval_seconds", "must be a number", val
-                ))
-            elif val < 0.1 or val > 3600:
-                errors.append(ConfigValidationError(
-                    f"{path}.interval_seconds", "must be between 0.1 and 3600", val
-                ))
-        
-        if "priority" in data:
-            val = data["priority"]
-            if val not in ("high", "medium", "low"):
-                errors.append(ConfigValidationError(
-                    f"{path}.priority", "must be 'high', 'medium', or 'low'", val
-                ))
-        
-        return errors
-    
-    def _validate_storage_config(self, path: str, data: Any) -> list[ConfigValidationError]:
-        """Validate storage configuration."""
-        errors: list[ConfigValidationError] = []
-        
-        if not isinstance(data, dict):
-            errors.append(ConfigValidationError(path, "must be a dictionary", type(data).__name__))
-            return errors
-        
-        if "max_file_size_mb" in data:
-            val = data["max_file_size_mb"]
-            if not isinstance(val, int) or val < 1 or val > 10000:
-                errors.append(ConfigValidationError(
-                    f"{path}.max_file_size_mb", "must be integer between 1 and 10000", val
-                ))
-        
-        if "buffer_size" in data:
-            val = data["buffer_size"]
-            if not isinstance(val, int) or val < 1 or val > 100000:
-                errors.append(ConfigValidationError(
-                    f"{path}.buffer_size", "must be integer between 1 and 100000", val
-                ))
-        
-        return errors
-    
-    def _validate_analysis_config(self, path: str, data: Any) -> list[ConfigValidationError]:
-        """Validate analysis configuration."""
-        errors: list[ConfigValidationError] = []
-        
-        if not isinstance(data, dict):
-            errors.append(ConfigValidationError(path, "must be a dictionary", type(data).__name__))
-            return errors
-        
-        if "window_size" in data:
-            val = data["window_size"]
-            if not isinstance(val, int) or val < 10 or val > 10000:
-                errors.append(ConfigValidationError(
-                    f"{path}.window_size", "must be integer between 10 and 10000", val
-                ))
-        
-        if "z_score_threshold" in data:
-            val = data["z_score_threshold"]
-            if not isinstance(val, (int, float)) or val < 1.0 or val > 10.0:
-                errors.append(ConfigValidationError(
-                    f"{path}.z_score_threshold", "must be number between 1.0 and 10.0", val
-                ))
-        
-        return errors
-    
-    def _validate_alerting_config(self, path: str, data: Any) -> list[ConfigValidationError]:
-        """Validate alerting configuration."""
-        errors: list[ConfigValidationError] = []
-        
+
+        return errors or _EMPTY_ERRORS
+
+    def _check_section(
+        self,
+        path: str,
+        data: Any,
+        rules: dict[str, tuple],
+        errors: list[ConfigValidationError],
+    ) -> None:
+        """Validate one config section against its rule table."""
+        append = errors.append
         if not isinstance(data, dict):
-            errors.append(ConfigValidationError(path, "must be a dictionary", type(data).__name__))
-            return errors
-        
-        if "cooldown_seconds" in data:
-            val = data["cooldown_seconds"]
-            if not isinstance(val, int) or val < 0 or val > 86400:
-                errors.append(ConfigValidationError(
-                    f"{path}.cooldown_seconds", "must be integer between 0 and 86400", val
-                ))
-        
-        if "min_cluster_sensors" in data:
-            val = data["min_cluster_sensors"]
-            if not isinstance(val, int) or val < 2 or val > 10:
-                errors.append(ConfigValidationError(
-                    f"{path}.min_cluster_sensors", "must be integer between 2 and 10", val
-                ))
-        
-        return errors
-    
+            append(ConfigValidationError(path, "must be a dictionary", type(data).__name__))
+            return
+
+        for key, rule in rules.items():
+            if key not in data:
+                continue
+            val = data[key]
+            kind = rule[0]
+            if kind == "range":
+                _, types, lo, hi, msg = rule
+                if not isinstance(val, types) or val < lo or val > hi:
+                    append(ConfigValidationError(f"{path}.{key}", msg, val))
+            elif kind == "number":
+                _, lo, hi, type_msg, range_msg = rule
+                if not isinstance(val, _NUM):
+                    append(ConfigValidationError(f"{path}.{key}", type_msg, val))
+                elif val < lo or val > hi:
+                    append(ConfigValidationError(f"{path}.{key}", range_msg, val))
+            elif kind == "bool":
+                if not isinstance(val, bool):
+                    append(ConfigValidationError(f"{path}.{key}", rule[1], val))
+            else:  # enum
+                _, allowed, msg = rule
+                if val not in allowed:
+                    append(ConfigValidationError(f"{path}.{key}", msg, val))
+
     def save_default(self, path: str | None = None) -> None:
         """Save default configuration to file.
         
         Args:
             path: Optional path override
         """
-        config_path = Path(path) if path else self.config_path
-        
+        config_path = os.fspath(path) if path else self._config_path_str
+        is_own_path = config_path == self._config_path_str
+
         with self._lock:
             self.config = Config.default()
-            
+            new_bytes = _json_dumps(self.config.to_dict()).encode("utf-8")
+
+            try:
+                with open(config_path, "rb") as f:
+                    if f.read() == new_bytes:
+                        return
+            except OSError:
+                pass
+
             # Ensure directory exists
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(config_path, "w", encoding="utf-8") as f:
-                f.write(self.config.to_json(indent=2))
-            
-            self._last_modified = config_path.stat().st_mtime
+            parent = self._parent_dir if is_own_path else (os.path.dirname(config_path) or ".")
+            os.makedirs(parent, exist_ok=True)
+
+            # Write to a sibling temp file and rename so readers never
+            # see a partially written config.
+            tmp_path = config_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(new_bytes)
+            os.replace(tmp_path, config_path)
+
+            stat = os.stat(config_path)
+            self._last_modified = stat.st_mtime
+            if is_own_path:
+                self._cache_key = (stat.st_mtime_ns, stat.st_size)
             logger.info(f"Default configuration saved to {config_path}")
     
     def reload(self) -> Config:
@@ -275,11 +332,12 @@ class ConfigManager:
         Returns:
             Reloaded configuration object
         """
-        old_config = self.config
+        old_version = self._version
         new_config = self.load()
-        
-        # Notify callbacks if config changed
-        if old_config != new_config:
+
+        # Notify callbacks if a new config was actually parsed; the
+        # version compare avoids a deep structural == over every section.
+        if self._version != old_version:
             for callback in self._reload_callbacks:
                 try:
                     callback(new_config)
@@ -294,19 +352,76 @@ class ConfigManager:
         Returns:
             True if file was modified since last load
         """
-        if not self.config_path.exists():
+        try:
+            stat = os.stat(self._config_path_str)
+        except FileNotFoundError:
             return False
-        
-        current_mtime = self.config_path.stat().st_mtime
-        return current_mtime > self._last_modified
+
+        return (stat.st_mtime_ns, stat.st_size) != self._cache_key
     
+    def start_watching(self) -> bool:
+        """Reload on filesystem events instead of mtime polling.
+
+        Uses watchdog (inotify/kqueue/ReadDirectoryChangesW) when it is
+        installed, so steady state costs zero syscalls and reloads land
+        as soon as the OS reports the write.
+
+        Returns:
+            True if a watcher was started; False when watchdog is not
+            available, in which case callers should keep polling
+            check_for_changes().
+        """
+        if Observer is None:
+            logger.info("watchdog not installed, keep polling check_for_changes()")
+            return False
+        if self._observer is not None:
+            return True
+
+        manager = self
+        target = os.path.abspath(self._config_path_str)
+
+        class _ConfigFileHandler(FileSystemEventHandler):
+            def on_modified(self, event):
+                if event.src_path == target:
+                    manager.reload()
+
+            def on_moved(self, event):
+                # Atomic saves land as a rename onto the config path.
+                if getattr(event, "dest_path", None) == target:
+                    manager.reload()
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_ConfigFileHandler(), self._parent_dir, recursive=False)
+        observer.start()
+        self._observer = observer
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the filesystem watcher started by start_watching()."""
+        observer = self._observer
+        if observer is not None:
+            observer.stop()
+            observer.join()
+            self._observer = None
+
     def on_reload(self, callback: Callable[[Config], None]) -> None:
         """Register a callback for configuration reload.
         
         Args:
             callback: Function to call with new config on reload
         """
-        self._reload_callbacks.append(callback)
+        self._reload_callbacks = (*self._reload_callbacks, callback)
+
+    def off_reload(self, callback: Callable[[Config], None]) -> None:
+        """Unregister a previously registered reload callback.
+
+        Args:
+            callback: Callback to remove; unknown callbacks are ignored
+        """
+        self._reload_callbacks = tuple(
+            cb for cb in self._reload_callbacks if cb != callback
+        )
     
     def get_validation_errors(self) -> list[ConfigValidationError]:
         """Get validation errors from last load.
@@ -314,7 +429,7 @@ class ConfigManager:
         Returns:
             List of validation errors
         """
-        return self._validation_errors.copy()
+        return list(self._validation_errors)
     
     def get_sensor_config(self, sensor_name: str) -> SensorConfig | None:
         """Get configuration for a specific sensor.
@@ -325,8 +440,10 @@ class ConfigManager:
         Returns:
             SensorConfig or None if not found
         """
-        with self._lock:
-            return self.config.sensors.get(sensor_name)
+        # Lock-free: load() and update_sensor_config() publish fully
+        # built objects with a single attribute store, so a plain read
+        # always sees a consistent config under the GIL.
+        return self.config.sensors.get(sensor_name)
     
     def update_sensor_config(self, sensor_name: str, **kwargs) -> None:
         """Update configuration for a specific sensor.
@@ -336,8 +453,17 @@ class ConfigManager:
             **kwargs: Configuration values to update
         """
         with self._lock:
-            if sensor_name in self.config.sensors:
-                sensor_cfg = self.config.sensors[sensor_name]
-                for key, value in kwargs.items():
-                    if hasattr(sensor_cfg, key):
-                        setattr(sensor_cfg, key, value)
+            sensors = self.config.sensors
+            sensor_cfg = sensors.get(sensor_name)
+            if sensor_cfg is None:
+                return
+            # Copy-on-write: mutate a clone, then swap the whole dict in
+            # one assignment so lock-free readers never see a half-update.
+            updated = replace(sensor_cfg)
+            for key, value in kwargs.items():
+                if hasattr(updated, key):
+                    setattr(updated, key, value)
+            new_sensors = dict(sensors)
+            new_sensors[sensor_name] = updated
+            self.config.sensors = new_sensors
+            self.config._enabled_cache = None
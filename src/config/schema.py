@@ -8,12 +8,53 @@ This module defines dataclasses for all configuration sections:
 - Config: Root configuration object
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 import json
+import sys
 
+# Interned priority literals: every SensorConfig shares the same three
+# string objects, so membership and equality checks are pointer compares.
+_HIGH = sys.intern("high")
+_MEDIUM = sys.intern("medium")
+_LOW = sys.intern("low")
 
-@dataclass
+# Allowed priority values; frozenset gives O(1) membership on the
+# validation path.
+_PRIORITIES = frozenset((_HIGH, _MEDIUM, _LOW))
+
+# Shared read-only stand-in for "no custom params"; avoids allocating an
+# empty dict per sensor when loading configs that omit the key.
+_EMPTY_PARAMS: MappingProxyType = MappingProxyType({})
+
+def _make_to_dict(fields: tuple[str, ...]):
+    """Generate a specialized to_dict for the given attribute names.
+
+    The exec'd function body is a single dict literal, so serializing a
+    section does no per-field introspection at call time.
+    """
+    body = ", ".join(f"{name!r}: self.{name}" for name in fields)
+    namespace: dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{body}}}", namespace)
+    return namespace["to_dict"]
+
+
+# Built-in sensors as (name, enabled, interval_seconds, priority); a
+# SensorConfig is only constructed for names missing from the loaded file.
+_DEFAULT_SENSOR_SPECS = (
+    ("system", True, 1.0, _HIGH),
+    ("time_drift", True, 2.0, _HIGH),
+    ("network", True, 5.0, _MEDIUM),
+    ("random", True, 5.0, _MEDIUM),
+    ("crypto", True, 2.0, _HIGH),
+    ("blockchain", True, 10.0, _LOW),
+    ("weather", True, 300.0, _LOW),
+    ("news", True, 900.0, _LOW),
+)
+
+
+@dataclass(slots=True)
 class SensorConfig:
     """Configuration for a single sensor.
     
@@ -30,27 +71,33 @@ class SensorConfig:
     
     def __post_init__(self):
         """Validate configuration values."""
-        if self.interval_seconds < 0.1:
-            self.interval_seconds = 0.1
-        if self.interval_seconds > 3600:
-            self.interval_seconds = 3600
-        if self.priority not in ("high", "medium", "low"):
-            self.priority = "medium"
+        self.interval_seconds = min(3600, max(0.1, self.interval_seconds))
+        if self.priority not in _PRIORITIES:
+            self.priority = _MEDIUM
+        else:
+            self.priority = sys.intern(self.priority)
     
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-    
+        params = self.custom_params
+        return {
+            "enabled": self.enabled,
+            "interval_seconds": self.interval_seconds,
+            "priority": self.priority,
+            # The shared empty proxy isn't JSON-serializable; realize it.
+            "custom_params": params if type(params) is dict else dict(params),
+        }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SensorConfig":
         return cls(
             enabled=data.get("enabled", True),
             interval_seconds=data.get("interval_seconds", 5.0),
-            priority=data.get("priority", "medium"),
-            custom_params=data.get("custom_params", {})
+            priority=data.get("priority", _MEDIUM),
+            custom_params=data.get("custom_params") or _EMPTY_PARAMS
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageConfig:
     """Configuration for data storage.
     
@@ -67,17 +114,12 @@ class StorageConfig:
     
     def __post_init__(self):
         """Validate configuration values."""
-        if self.max_file_size_mb < 1:
-            self.max_file_size_mb = 1
-        if self.max_file_size_mb > 10000:
-            self.max_file_size_mb = 10000
-        if self.buffer_size < 1:
-            self.buffer_size = 1
-        if self.buffer_size > 100000:
-            self.buffer_size = 100000
+        self.max_file_size_mb = min(10000, max(1, self.max_file_size_mb))
+        self.buffer_size = min(100000, max(1, self.buffer_size))
     
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    to_dict = _make_to_dict(
+        ("base_path", "compression", "max_file_size_mb", "buffer_size")
+    )
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "StorageConfig":
@@ -89,7 +131,7 @@ class StorageConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisConfig:
     """Configuration for analysis parameters.
     
@@ -110,33 +152,21 @@ class AnalysisConfig:
     
     def __post_init__(self):
         """Validate configuration values."""
-        if self.window_size < 10:
-            self.window_size = 10
-        if self.window_size > 10000:
-            self.window_size = 10000
-        if self.z_score_threshold < 1.0:
-            self.z_score_threshold = 1.0
-        if self.z_score_threshold > 10.0:
-            self.z_score_threshold = 10.0
-        if self.lag_range_seconds < 1:
-            self.lag_range_seconds = 1
-        if self.lag_range_seconds > 3600:
-            self.lag_range_seconds = 3600
-        if self.cluster_window_seconds < 0.1:
-            self.cluster_window_seconds = 0.1
-        if self.cluster_window_seconds > 60.0:
-            self.cluster_window_seconds = 60.0
-        if self.correlation_threshold < 0.0:
-            self.correlation_threshold = 0.0
-        if self.correlation_threshold > 1.0:
-            self.correlation_threshold = 1.0
-        if self.precursor_threshold < 0.0:
-            self.precursor_threshold = 0.0
-        if self.precursor_threshold > 1.0:
-            self.precursor_threshold = 1.0
+        self.window_size = min(10000, max(10, self.window_size))
+        self.z_score_threshold = min(10.0, max(1.0, self.z_score_threshold))
+        self.lag_range_seconds = min(3600, max(1, self.lag_range_seconds))
+        self.cluster_window_seconds = min(60.0, max(0.1, self.cluster_window_seconds))
+        self.correlation_threshold = min(1.0, max(0.0, self.correlation_threshold))
+        self.precursor_threshold = min(1.0, max(0.0, self.precursor_threshold))
     
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    to_dict = _make_to_dict((
+        "window_size",
+        "z_score_threshold",
+        "lag_range_seconds",
+        "cluster_window_seconds",
+        "correlation_threshold",
+        "precursor_threshold",
+    ))
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AnalysisConfig":
@@ -150,7 +180,7 @@ class AnalysisConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig:
     """Configuration for Telegram bot.
     
@@ -167,13 +197,9 @@ class TelegramConfig:
     
     def __post_init__(self):
         """Validate configuration values."""
-        if self.cooldown_seconds < 0:
-            self.cooldown_seconds = 0
-        if self.cooldown_seconds > 86400:
-            self.cooldown_seconds = 86400
+        self.cooldown_seconds = min(86400, max(0, self.cooldown_seconds))
     
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    to_dict = _make_to_dict(("enabled", "token", "chat_id", "cooldown_seconds"))
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TelegramConfig":
@@ -185,7 +211,7 @@ class TelegramConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertingConfig:
     """Configuration for alerting system.
     
@@ -210,25 +236,24 @@ class AlertingConfig:
     
     def __post_init__(self):
         """Validate configuration values."""
-        if self.cooldown_seconds < 0:
-            self.cooldown_seconds = 0
-        if self.cooldown_seconds > 86400:
-            self.cooldown_seconds = 86400
-        if self.min_cluster_sensors < 2:
-            self.min_cluster_sensors = 2
-        if self.min_cluster_sensors > 10:
-            self.min_cluster_sensors = 10
+        self.cooldown_seconds = min(86400, max(0, self.cooldown_seconds))
+        self.min_cluster_sensors = min(10, max(2, self.min_cluster_sensors))
     
     def to_dict(self) -> dict[str, Any]:
-        result = asdict(self)
-        # Handle nested TelegramConfig
-        if isinstance(self.telegram, TelegramConfig):
-            result["telegram"] = self.telegram.to_dict()
-        return result
+        return {
+            "enabled": self.enabled,
+            "webhook_url": self.webhook_url,
+            "cooldown_seconds": self.cooldown_seconds,
+            "alert_on_clusters": self.alert_on_clusters,
+            "alert_on_correlations": self.alert_on_correlations,
+            "alert_on_sensor_failure": self.alert_on_sensor_failure,
+            "min_cluster_sensors": self.min_cluster_sensors,
+            "telegram": self.telegram.to_dict(),
+        }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AlertingConfig":
-        telegram_data = data.get("telegram", {})
+        telegram_data = data.get("telegram")
         return cls(
             enabled=data.get("enabled", False),
             webhook_url=data.get("webhook_url"),
@@ -237,11 +262,11 @@ class AlertingConfig:
             alert_on_correlations=data.get("alert_on_correlations", True),
             alert_on_sensor_failure=data.get("alert_on_sensor_failure", True),
             min_cluster_sensors=data.get("min_cluster_sensors", 3),
-            telegram=TelegramConfig.from_dict(telegram_data)
+            telegram=TelegramConfig.from_dict(telegram_data) if telegram_data else TelegramConfig()
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Root configuration object for Matrix Watcher.
     
@@ -257,24 +282,18 @@ class Config:
     analysis: AnalysisConfig = field(default_factory=AnalysisConfig)
     alerting: AlertingConfig = field(default_factory=AlertingConfig)
     api_keys: dict[str, str] = field(default_factory=dict)
-    
+    _enabled_cache: list[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Initialize default sensor configs if not provided."""
-        default_sensors = {
-            "system": SensorConfig(enabled=True, interval_seconds=1.0, priority="high"),
-            "time_drift": SensorConfig(enabled=True, interval_seconds=2.0, priority="high"),
-            "network": SensorConfig(enabled=True, interval_seconds=5.0, priority="medium"),
-            "random": SensorConfig(enabled=True, interval_seconds=5.0, priority="medium"),
-            "crypto": SensorConfig(enabled=True, interval_seconds=2.0, priority="high"),
-            "blockchain": SensorConfig(enabled=True, interval_seconds=10.0, priority="low"),
-            "weather": SensorConfig(enabled=True, interval_seconds=300.0, priority="low"),
-            "news": SensorConfig(enabled=True, interval_seconds=900.0, priority="low"),
-        }
-        
-        # Merge with defaults
-        for name, default_config in default_sensors.items():
-            if name not in self.sensors:
-                self.sensors[name] = default_config
+        sensors = self.sensors
+        for name, enabled, interval, priority in _DEFAULT_SENSOR_SPECS:
+            if name not in sensors:
+                sensors[name] = SensorConfig(
+                    enabled=enabled, interval_seconds=interval, priority=priority
+                )
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -294,14 +313,22 @@ class Config:
     def from_dict(cls, data: dict[str, Any]) -> "Config":
         """Create Config from dictionary."""
         sensors = {}
-        for name, sensor_data in data.get("sensors", {}).items():
-            sensors[name] = SensorConfig.from_dict(sensor_data)
-        
+        sensor_data_map = data.get("sensors")
+        if sensor_data_map:
+            from_sensor = SensorConfig.from_dict
+            for name, sensor_data in sensor_data_map.items():
+                sensors[name] = from_sensor(sensor_data)
+
+        # Absent sections skip the per-field .get chain and take the
+        # default constructor directly.
+        storage = data.get("storage")
+        analysis = data.get("analysis")
+        alerting = data.get("alerting")
         return cls(
             sensors=sensors,
-            storage=StorageConfig.from_dict(data.get("storage", {})),
-            analysis=AnalysisConfig.from_dict(data.get("analysis", {})),
-            alerting=AlertingConfig.from_dict(data.get("alerting", {})),
+            storage=StorageConfig.from_dict(storage) if storage else StorageConfig(),
+            analysis=AnalysisConfig.from_dict(analysis) if analysis else AnalysisConfig(),
+            alerting=AlertingConfig.from_dict(alerting) if alerting else AlertingConfig(),
             api_keys=data.get("api_keys", {})
         )
     
@@ -323,5 +350,13 @@ class Config:
         )
     
     def get_enabled_sensors(self) -> list[str]:
-        """Get list of enabled sensor names."""
-        return [name for name, cfg in self.sensors.items() if cfg.enabled]
+        """Get list of enabled sensor names.
+
+        Cached after the first call; callers that mutate sensor configs
+        directly should reset `_enabled_cache` to None.
+        """
+        enabled = self._enabled_cache
+        if enabled is None:
+            enabled = [name for name, cfg in self.sensors.items() if cfg.enabled]
+            self._enabled_cache = enabled
+        return enabled
@@ -4,45 +4,125 @@ Implements publish-subscribe pattern for event distribution between components.
 Supports event filtering, buffering, and multiple subscribers.
 """
 
+import functools
+import itertools
 import logging
+import queue
 import threading
-import uuid
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, Any
 
-from .types import Event, EventType, Severity
+from .types import Event, EventType, Severity, _EVENT_TYPE_BIT, _SEVERITY_RANK
 
 logger = logging.getLogger(__name__)
 
+# Posted to the async queue to stop the worker thread.
+_ASYNC_STOP = object()
 
-@dataclass
+
+def _count_value(counter: "itertools.count") -> int:
+    """Current value of an itertools.count without consuming it."""
+    return counter.__reduce__()[1][0]
+
+
+def _advance(counter: "itertools.count", n: int) -> None:
+    """Advance a counter by n in one C-level step."""
+    if n == 1:
+        next(counter)
+    elif n > 1:
+        next(itertools.islice(counter, n - 1, n))
+
+# Severity ordering shared by every filter; built once instead of per
+# matches() call.
+_SEV_RANK = _SEVERITY_RANK
+
+
+@dataclass(frozen=True)
 class EventFilter:
     """Filter criteria for event subscription.
-    
+
+    Immutable so identical filters can be shared between subscriptions.
+
     Attributes:
-        event_types: List of event types to receive (None = all)
-        sources: List of sources to receive (None = all)
+        event_types: Event types to receive (None = all)
+        sources: Sources to receive (None = all)
         min_severity: Minimum severity level to receive
     """
-    event_types: list[EventType] | None = None
-    sources: list[str] | None = None
+    event_types: tuple[EventType, ...] | list[EventType] | None = None
+    sources: tuple[str, ...] | list[str] | None = None
     min_severity: Severity | None = None
-    
+    _type_mask: int = field(default=-1, init=False, repr=False, compare=False)
+    _source_set: frozenset | None = field(default=None, init=False, repr=False, compare=False)
+    _min_rank: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute mask/set/rank forms of the criteria for the hot path."""
+        if self.event_types:
+            type_mask = 0
+            for event_type in self.event_types:
+                type_mask |= _EVENT_TYPE_BIT[EventType(event_type)]
+            object.__setattr__(self, "_type_mask", type_mask)
+        if self.sources:
+            object.__setattr__(self, "_source_set", frozenset(self.sources))
+        if self.min_severity is not None:
+            object.__setattr__(self, "_min_rank", _SEV_RANK.get(self.min_severity, 0))
+        object.__setattr__(self, "matches", self._compile_matches())
+
+    def _compile_matches(self) -> Callable[[Event], bool]:
+        """Generate a match function testing only the active criteria.
+
+        A subscription filtering on types and severity, say, gets
+        ``lambda-like`` bytecode with exactly those two checks inlined
+        as constants — fewer instructions than the generic three-branch
+        method, and shared by every subscriber via the filter cache.
+        """
+        conds = []
+        scope = {}
+        if self.event_types:
+            conds.append(f"(e.type_bit & {self._type_mask}) != 0")
+        if self.sources:
+            conds.append("e.source in _sources")
+            scope["_sources"] = self._source_set
+        if self.min_severity is not None:
+            conds.append(f"e._sev_rank >= {self._min_rank}")
+        src = "def _m(e): return " + (" and ".join(conds) if conds else "True")
+        exec(compile(src, "<event-filter>", "exec"), scope)
+        return scope["_m"]
+
+    # Replaced per-instance by _compile_matches; kept as the reference
+    # implementation of the filter semantics.
     def matches(self, event: Event) -> bool:
         """Check if event matches filter criteria."""
-        if self.event_types is not None and event.event_type not in self.event_types:
+        if not (event.type_bit & self._type_mask):
             return False
-        if self.sources is not None and event.source not in self.sources:
+        if self._source_set is not None and event.source not in self._source_set:
+            return False
+        if event._sev_rank < self._min_rank:
             return False
-        if self.min_severity is not None:
-            severity_order = {Severity.INFO: 0, Severity.WARNING: 1, Severity.CRITICAL: 2}
-            if severity_order.get(event.severity, 0) < severity_order.get(self.min_severity, 0):
-                return False
         return True
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _get_filter(
+    event_types_key: tuple[EventType, ...] | None,
+    sources_key: tuple[str, ...] | None,
+    min_severity: Severity | None,
+) -> EventFilter:
+    """Return a shared EventFilter for the given criteria.
+
+    Many subscribers register identical criteria (e.g. every "warning
+    and up" dashboard); interning the filter lets them all share one
+    instance and one matches() code path in the publish loop.
+    """
+    return EventFilter(
+        event_types=event_types_key,
+        sources=sources_key,
+        min_severity=min_severity,
+    )
+
+
+@dataclass(slots=True)
 class Subscription:
     """Represents a subscription to the event bus.
     
@@ -59,13 +139,26 @@ class Subscription:
     filter: EventFilter | None = None
     buffer: deque = field(default_factory=lambda: deque(maxlen=1000))
     max_buffer_size: int = 1000
-    dropped_count: int = 0
-    _lock: threading.Lock = field(default_factory=threading.Lock)
-    
+    # When True, callback receives a list of events per publish_many
+    # call instead of one event per invocation.
+    batch_callback: bool = False
+    # When True, failed deliveries keep only the newest event in a
+    # single slot instead of queueing up to max_buffer_size of them.
+    latest_only: bool = False
+    _latest: Event | None = None
+    # No lock: deque.append/popleft and itertools.count increments are
+    # single C calls, atomic under the GIL.
+    _dropped_counter: itertools.count = field(default_factory=itertools.count)
+
     def __post_init__(self):
         # Recreate buffer with correct maxlen
         self.buffer = deque(maxlen=self.max_buffer_size)
 
+    @property
+    def dropped_count(self) -> int:
+        """Number of events dropped due to buffer overflow."""
+        return _count_value(self._dropped_counter)
+
 
 class EventBus:
     """Central event distribution mechanism.
@@ -94,51 +187,73 @@ class EventBus:
             max_buffer_size: Maximum events to buffer per subscriber
         """
         self._subscriptions: dict[str, Subscription] = {}
+        # Copy-on-write snapshot of the subscriptions; rebuilt under the
+        # lock on (un)subscribe so publish can read it lock-free.
+        self._sub_tuple: tuple[Subscription, ...] = ()
         self._lock = threading.RLock()
         self._max_buffer_size = max_buffer_size
-        self._total_published = 0
-        self._total_delivered = 0
-        self._total_dropped = 0
+        # itertools.count increments happen in C under the GIL, so the
+        # publish path needs no lock around its stats.
+        self._published_counter = itertools.count()
+        self._delivered_counter = itertools.count()
+        self._dropped_counter = itertools.count()
+        # Lazily started worker draining publish_async events; spawning
+        # a Thread per event is far too expensive at high rates.
+        self._async_queue: queue.SimpleQueue | None = None
+        self._async_worker: threading.Thread | None = None
+        # Subscription IDs are opaque local handles; a monotonic counter
+        # avoids the urandom read and hex formatting of uuid4.
+        self._next_id = itertools.count(1)
     
     def subscribe(
         self,
         callback: Callable[[Event], None],
         event_types: list[EventType] | None = None,
         sources: list[str] | None = None,
-        min_severity: Severity | None = None
+        min_severity: Severity | None = None,
+        batch: bool = False,
+        latest_only: bool = False
     ) -> str:
         """Subscribe to events.
-        
+
         Args:
             callback: Function to call with matching events
             event_types: Filter by event types (None = all)
             sources: Filter by sources (None = all)
             min_severity: Minimum severity level
-            
+            batch: If True, callback receives a list of events from
+                publish_many instead of one event per call
+            latest_only: If True, only the newest undelivered event is
+                retained for retry — suited to dashboard-style consumers
+                that only care about the current value
+
         Returns:
             Subscription ID for unsubscribing
         """
-        sub_id = str(uuid.uuid4())
+        sub_id = str(next(self._next_id))
         
         event_filter = None
         if event_types or sources or min_severity:
-            event_filter = EventFilter(
-                event_types=event_types,
-                sources=sources,
-                min_severity=min_severity
+            event_filter = _get_filter(
+                tuple(event_types) if event_types else None,
+                tuple(sources) if sources else None,
+                min_severity
             )
         
         subscription = Subscription(
             id=sub_id,
             callback=callback,
             filter=event_filter,
-            max_buffer_size=self._max_buffer_size
+            max_buffer_size=self._max_buffer_size,
+            batch_callback=batch,
+            latest_only=latest_only
         )
         
         with self._lock:
             self._subscriptions[sub_id] = subscription
+            self._sub_tuple = tuple(self._subscriptions.values())
         
-        logger.debug(f"New subscription: {sub_id}")
+        logger.debug("New subscription: %s", sub_id)
         return sub_id
     
     def unsubscribe(self, subscription_id: str) -> bool:
@@ -153,7 +268,8 @@ class EventBus:
         with self._lock:
             if subscription_id in self._subscriptions:
                 del self._subscriptions[subscription_id]
-                logger.debug(f"Unsubscribed: {subscription_id}")
+                self._sub_tuple = tuple(self._subscriptions.values())
+                logger.debug("Unsubscribed: %s", subscription_id)
                 return True
         return False
     
@@ -167,42 +283,156 @@ class EventBus:
             Number of subscribers that received the event
         """
         delivered = 0
-        
-        with self._lock:
-            self._total_published += 1
-            subscriptions = list(self._subscriptions.values())
-        
+
+        # Lock-free: reading the tuple reference is atomic and counter
+        # increments are C-level.
+        next(self._published_counter)
+        subscriptions = self._sub_tuple
+
         for sub in subscriptions:
-            # Check filter
-            if sub.filter and not sub.filter.matches(event):
-                continue
+            # Check filter; the mask AND cheaply rejects wrong-type
+            # events before the full matches() call.
+            sub_filter = sub.filter
+            if sub_filter is not None:
+                if not (event.type_bit & sub_filter._type_mask):
+                    continue
+                if not sub_filter.matches(event):
+                    continue
             
             # Try to deliver
             try:
                 sub.callback(event)
                 delivered += 1
-                self._total_delivered += 1
+                next(self._delivered_counter)
             except Exception as e:
-                logger.error(f"Error in subscriber {sub.id}: {e}")
+                logger.error("Error in subscriber %s: %s", sub.id, e)
                 # Buffer the event for retry
-                with sub._lock:
-                    if len(sub.buffer) >= sub.max_buffer_size:
-                        # Drop oldest event
-                        sub.buffer.popleft()
-                        sub.dropped_count += 1
-                        self._total_dropped += 1
-                    sub.buffer.append(event)
+                self._buffer_event(sub, event)
         
         return delivered
     
+    def publish_many(self, events: list[Event]) -> int:
+        """Publish a batch of events with one lock/snapshot round trip.
+
+        Filters are evaluated per subscriber over the whole batch; batch
+        subscribers (``batch=True``) get one callback call with the list
+        of matching events, others get one call per event as in publish.
+
+        Args:
+            events: Events to publish, in order
+
+        Returns:
+            Total number of deliveries (events x subscribers)
+        """
+        if not events:
+            return 0
+
+        delivered = 0
+
+        _advance(self._published_counter, len(events))
+        subscriptions = self._sub_tuple
+
+        for sub in subscriptions:
+            sub_filter = sub.filter
+            if sub_filter is None:
+                matched = events
+            else:
+                matches = sub_filter.matches
+                matched = [e for e in events if matches(e)]
+                if not matched:
+                    continue
+
+            if sub.batch_callback:
+                try:
+                    sub.callback(matched)
+                    delivered += len(matched)
+                    _advance(self._delivered_counter, len(matched))
+                except Exception as e:
+                    logger.error("Error in subscriber %s: %s", sub.id, e)
+                    for event in matched:
+                        self._buffer_event(sub, event)
+                continue
+
+            for event in matched:
+                try:
+                    sub.callback(event)
+                    delivered += 1
+                    next(self._delivered_counter)
+                except Exception as e:
+                    logger.error("Error in subscriber %s: %s", sub.id, e)
+                    self._buffer_event(sub, event)
+
+        return delivered
+
+    def _buffer_event(self, sub: Subscription, event: Event) -> None:
+        """Buffer an event for retry after a failed delivery."""
+        if sub.latest_only:
+            # Single-slot coalescing: a plain reference assignment is
+            # atomic under the GIL, so no lock and no deque bookkeeping.
+            if sub._latest is not None:
+                next(sub._dropped_counter)
+                next(self._dropped_counter)
+            sub._latest = event
+            return
+        buffer = sub.buffer
+        if len(buffer) >= sub.max_buffer_size:
+            # Drop oldest event
+            try:
+                buffer.popleft()
+            except IndexError:
+                pass  # another thread drained it first
+            else:
+                next(sub._dropped_counter)
+                next(self._dropped_counter)
+        buffer.append(event)
+
     def publish_async(self, event: Event) -> None:
         """Publish event asynchronously (non-blocking).
-        
+
+        Events are handed to a single persistent worker thread, started
+        on first use, instead of spawning a thread per event.
+
         Args:
             event: Event to publish
         """
-        thread = threading.Thread(target=self.publish, args=(event,), daemon=True)
-        thread.start()
+        if self._async_worker is None:
+            self._ensure_async_worker()
+        self._async_queue.put(event)
+
+    def _ensure_async_worker(self) -> None:
+        """Start the async publish worker if not already running."""
+        with self._lock:
+            if self._async_worker is not None:
+                return
+            self._async_queue = queue.SimpleQueue()
+            worker = threading.Thread(
+                target=self._drain_async, name="event-bus-async", daemon=True
+            )
+            self._async_worker = worker
+            worker.start()
+
+    def _drain_async(self) -> None:
+        """Worker loop: publish queued events until stopped."""
+        async_queue = self._async_queue
+        while True:
+            event = async_queue.get()
+            if event is _ASYNC_STOP:
+                break
+            self.publish(event)
+
+    def shutdown_async(self, timeout: float = 5.0) -> None:
+        """Stop the async publish worker after draining queued events.
+
+        Args:
+            timeout: Maximum time to wait for the worker to exit
+        """
+        with self._lock:
+            worker = self._async_worker
+            if worker is None:
+                return
+            self._async_queue.put(_ASYNC_STOP)
+            self._async_worker = None
+        worker.join(timeout=timeout)
     
     def get_buffer_size(self, subscription_id: str) -> int:
         """Get current buffer size for a subscriber.
@@ -245,22 +475,33 @@ class EventBus:
             if subscription_id not in self._subscriptions:
                 return 0
             sub = self._subscriptions[subscription_id]
-        
+
         delivered = 0
+
+        if sub.latest_only:
+            event = sub._latest
+            if event is None:
+                return 0
+            try:
+                sub.callback(event)
+                sub._latest = None
+                return 1
+            except Exception:
+                return 0
         while True:
-            with sub._lock:
-                if not sub.buffer:
-                    break
-                event = sub.buffer[0]
-            
+            try:
+                event = sub.buffer.popleft()
+            except IndexError:
+                break
+
             try:
                 sub.callback(event)
-                with sub._lock:
-                    sub.buffer.popleft()
                 delivered += 1
             except Exception:
+                # Put it back for a later retry
+                sub.buffer.appendleft(event)
                 break
-        
+
         return delivered
     
     def get_stats(self) -> dict[str, Any]:
@@ -269,16 +510,16 @@ class EventBus:
         Returns:
             Dictionary with stats
         """
-        with self._lock:
-            return {
-                "subscriber_count": len(self._subscriptions),
-                "total_published": self._total_published,
-                "total_delivered": self._total_delivered,
-                "total_dropped": self._total_dropped,
-            }
+        return {
+            "subscriber_count": len(self._sub_tuple),
+            "total_published": _count_value(self._published_counter),
+            "total_delivered": _count_value(self._delivered_counter),
+            "total_dropped": _count_value(self._dropped_counter),
+        }
     
     def clear(self) -> None:
         """Remove all subscriptions."""
         with self._lock:
             self._subscriptions.clear()
+            self._sub_tuple = ()
             logger.info("Event bus cleared")
@@ -7,15 +7,18 @@ Manages periodic execution of sensor tasks with:
 - Execution timing and drift logging
 """
 
+import array
 import asyncio
+import heapq
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Callable, Any
 from enum import Enum
 
-from .types import Priority, TaskStats
+from .types import Priority, TaskStats, _PRIORITY_RANK
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +31,7 @@ class TaskState(str, Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledTask:
     """Represents a scheduled task.
     
@@ -38,23 +41,22 @@ class ScheduledTask:
         interval: Execution interval in seconds
         priority: Task priority
         state: Current task state
-        stats: Execution statistics
         _running: Flag to prevent overlap
         _lock: Thread lock for state changes
+        _idx: Slot index into the scheduler's stat arrays
     """
     name: str
     callback: Callable[[], Any]
     interval: float
     priority: Priority
     state: TaskState = TaskState.PENDING
-    stats: TaskStats = field(default_factory=lambda: TaskStats(name=""))
     _running: bool = False
     _lock: threading.Lock = field(default_factory=threading.Lock)
     _next_run: float = 0.0
-    
+    _idx: int = -1
+
     def __post_init__(self):
-        self.stats = TaskStats(name=self.name)
-        self._next_run = time.time()
+        self._next_run = time.monotonic()
 
 
 class Scheduler:
@@ -85,12 +87,34 @@ class Scheduler:
             max_concurrent: Maximum concurrent task executions
         """
         self._tasks: dict[str, ScheduledTask] = {}
+        # Min-heap of (next_run, priority_rank, name); stale entries are
+        # skipped lazily when popped, so reschedules just push anew.
+        self._heap: list[tuple[float, int, str]] = []
         self._lock = threading.RLock()
         self._running = False
         self._thread: threading.Thread | None = None
         self._max_concurrent = max_concurrent
-        self._semaphore = threading.Semaphore(max_concurrent)
+        # Reused worker threads; the executor's queue also bounds
+        # concurrency, replacing the old per-run thread + semaphore.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="sched"
+        )
         self._stop_event = threading.Event()
+        # Sleep target for the run loop; set on every heap mutation so
+        # newly registered or resumed tasks interrupt an exact-length
+        # sleep instead of waiting out a polling tick.
+        self._wake_event = threading.Event()
+        # Per-task stats as structure-of-arrays, indexed by task slot;
+        # _run_task writes contiguous typed slots instead of eight
+        # attribute stores, and TaskStats views are built on demand.
+        self._stat_last_run = array.array("d")
+        self._stat_next_run = array.array("d")
+        self._stat_run_count = array.array("L")
+        self._stat_error_count = array.array("L")
+        self._stat_avg_ms = array.array("d")
+        self._stat_drift_ms = array.array("d")
+        self._stat_failures = array.array("L")
+        self._free_slots: list[int] = []
     
     def register_task(
         self,
@@ -122,8 +146,60 @@ class Scheduler:
         )
         
         with self._lock:
+            old = self._tasks.get(name)
+            task._idx = old._idx if old is not None else self._alloc_slot()
+            self._reset_slot(task._idx)
             self._tasks[name] = task
-            logger.info(f"Registered task: {name} (interval={interval}s, priority={priority.value})")
+            self._push_task(task)
+            logger.info("Registered task: %s (interval=%ss, priority=%s)", name, interval, priority.value)
+
+    def _alloc_slot(self) -> int:
+        """Allocate a stat-array slot (caller holds lock)."""
+        if self._free_slots:
+            return self._free_slots.pop()
+        idx = len(self._stat_last_run)
+        self._stat_last_run.append(0.0)
+        self._stat_next_run.append(0.0)
+        self._stat_run_count.append(0)
+        self._stat_error_count.append(0)
+        self._stat_avg_ms.append(0.0)
+        self._stat_drift_ms.append(0.0)
+        self._stat_failures.append(0)
+        return idx
+
+    def _reset_slot(self, idx: int) -> None:
+        """Zero a stat-array slot for a (re)registered task."""
+        self._stat_last_run[idx] = 0.0
+        self._stat_next_run[idx] = 0.0
+        self._stat_run_count[idx] = 0
+        self._stat_error_count[idx] = 0
+        self._stat_avg_ms[idx] = 0.0
+        self._stat_drift_ms[idx] = 0.0
+        self._stat_failures[idx] = 0
+
+    def _stats_view(self, task: ScheduledTask) -> TaskStats:
+        """Materialize a TaskStats snapshot from the stat arrays."""
+        idx = task._idx
+        last_run = self._stat_last_run[idx]
+        next_run = self._stat_next_run[idx]
+        return TaskStats(
+            name=task.name,
+            last_run=last_run or None,
+            next_run=next_run or None,
+            run_count=self._stat_run_count[idx],
+            error_count=self._stat_error_count[idx],
+            avg_duration_ms=self._stat_avg_ms[idx],
+            last_drift_ms=self._stat_drift_ms[idx],
+            consecutive_failures=self._stat_failures[idx],
+        )
+
+    def _push_task(self, task: ScheduledTask) -> None:
+        """Add a task's next firing to the ready heap (caller holds lock)."""
+        heapq.heappush(
+            self._heap,
+            (task._next_run, _PRIORITY_RANK.get(task.priority, 1), task.name),
+        )
+        self._wake_event.set()
     
     def unregister_task(self, name: str) -> bool:
         """Unregister a task.
@@ -136,8 +212,9 @@ class Scheduler:
         """
         with self._lock:
             if name in self._tasks:
+                self._free_slots.append(self._tasks[name]._idx)
                 del self._tasks[name]
-                logger.info(f"Unregistered task: {name}")
+                logger.info("Unregistered task: %s", name)
                 return True
         return False
     
@@ -148,6 +225,12 @@ class Scheduler:
         
         self._running = True
         self._stop_event.clear()
+        if self._executor._shutdown:
+            # stop() shut the pool down; a restarted scheduler needs a
+            # fresh one
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrent, thread_name_prefix="sched"
+            )
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
         logger.info("Scheduler started")
@@ -163,11 +246,13 @@ class Scheduler:
         
         self._running = False
         self._stop_event.set()
+        self._wake_event.set()
         
         if self._thread:
             self._thread.join(timeout=timeout)
             self._thread = None
-        
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
         logger.info("Scheduler stopped")
     
     def pause_task(self, name: str) -> bool:
@@ -182,7 +267,7 @@ class Scheduler:
         with self._lock:
             if name in self._tasks:
                 self._tasks[name].state = TaskState.PAUSED
-                logger.info(f"Paused task: {name}")
+                logger.info("Paused task: %s", name)
                 return True
         return False
     
@@ -200,8 +285,9 @@ class Scheduler:
                 task = self._tasks[name]
                 if task.state == TaskState.PAUSED:
                     task.state = TaskState.PENDING
-                    task._next_run = time.time()  # Run immediately
-                    logger.info(f"Resumed task: {name}")
+                    task._next_run = time.monotonic()  # Run immediately
+                    self._push_task(task)
+                    logger.info("Resumed task: %s", name)
                     return True
         return False
     
@@ -212,7 +298,7 @@ class Scheduler:
             Dictionary of task name to TaskStats
         """
         with self._lock:
-            return {name: task.stats for name, task in self._tasks.items()}
+            return {name: self._stats_view(task) for name, task in self._tasks.items()}
     
     def get_task_stats(self, name: str) -> TaskStats | None:
         """Get statistics for a specific task.
@@ -225,49 +311,57 @@ class Scheduler:
         """
         with self._lock:
             if name in self._tasks:
-                return self._tasks[name].stats
+                return self._stats_view(self._tasks[name])
         return None
     
     def _run_loop(self) -> None:
         """Main scheduler loop."""
         while self._running and not self._stop_event.is_set():
-            now = time.time()
-            
-            # Get tasks ready to run, sorted by priority
-            ready_tasks = self._get_ready_tasks(now)
-            
+            now = time.monotonic()
+
+            # Pop due tasks off the heap; O(1) peek when nothing is due
+            ready_tasks = self._pop_due_tasks(now)
+
             # Execute ready tasks
             for task in ready_tasks:
                 if not self._running:
                     break
                 self._execute_task(task)
-            
-            # Sleep briefly to avoid busy-waiting
-            self._stop_event.wait(timeout=0.1)
-    
-    def _get_ready_tasks(self, now: float) -> list[ScheduledTask]:
-        """Get tasks ready to run, sorted by priority.
-        
+
+            # Sleep exactly until the next firing; heap mutations set
+            # the wake event, so no polling cap is needed and an idle
+            # scheduler costs no wake-ups at all
+            with self._lock:
+                wait = self._heap[0][0] - time.monotonic() if self._heap else None
+            if wait is None or wait > 0:
+                self._wake_event.wait(timeout=wait)
+            self._wake_event.clear()
+
+    def _pop_due_tasks(self, now: float) -> list[ScheduledTask]:
+        """Pop tasks due at `now` off the heap, highest priority first.
+
+        Stale entries (task unregistered, rescheduled, paused or still
+        running) are discarded lazily as they surface.
+
         Args:
-            now: Current timestamp
-            
+            now: Current monotonic timestamp
+
         Returns:
-            List of ready tasks, highest priority first
+            List of due tasks; heap order already sorts ties by priority
         """
-        priority_order = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
         ready = []
-        
+
         with self._lock:
-            for task in self._tasks.values():
-                if task.state == TaskState.PAUSED:
-                    continue
-                if task._running:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                next_run, _, name = heapq.heappop(heap)
+                task = self._tasks.get(name)
+                if task is None or next_run != task._next_run:
+                    continue  # stale entry
+                if task.state == TaskState.PAUSED or task._running:
                     continue
-                if task._next_run <= now:
-                    ready.append(task)
-        
-        # Sort by priority (high first)
-        ready.sort(key=lambda t: priority_order.get(t.priority, 1))
+                ready.append(task)
+
         return ready
     
     def _execute_task(self, task: ScheduledTask) -> None:
@@ -279,18 +373,19 @@ class Scheduler:
         # Check if already running (prevent overlap)
         with task._lock:
             if task._running:
-                logger.debug(f"Task {task.name} already running, skipping")
+                logger.debug("Task %s already running, skipping", task.name)
                 return
             task._running = True
             task.state = TaskState.RUNNING
         
-        # Execute in thread pool
-        thread = threading.Thread(
-            target=self._run_task,
-            args=(task,),
-            daemon=True
-        )
-        thread.start()
+        # Execute on the shared worker pool
+        try:
+            self._executor.submit(self._run_task, task)
+        except RuntimeError:
+            # Executor already shut down (scheduler stopping)
+            with task._lock:
+                task._running = False
+                task.state = TaskState.PENDING
     
     def _run_task(self, task: ScheduledTask) -> None:
         """Run a task and update statistics.
@@ -299,56 +394,59 @@ class Scheduler:
             task: Task to run
         """
         scheduled_time = task._next_run
+        start_mono = time.monotonic()
         start_time = time.time()
-        drift_ms = (start_time - scheduled_time) * 1000
-        
+        drift_ms = (start_mono - scheduled_time) * 1000
+        idx = task._idx
+
         try:
-            # Acquire semaphore to limit concurrency
-            if not self._semaphore.acquire(timeout=1.0):
-                logger.warning(f"Task {task.name} could not acquire semaphore")
-                return
-            
-            try:
-                task.callback()
-                
-                # Update stats on success
-                end_time = time.time()
-                duration_ms = (end_time - start_time) * 1000
-                
-                task.stats.run_count += 1
-                task.stats.last_run = start_time
-                task.stats.last_drift_ms = drift_ms
-                task.stats.consecutive_failures = 0
-                
-                # Update average duration
-                if task.stats.avg_duration_ms == 0:
-                    task.stats.avg_duration_ms = duration_ms
-                else:
-                    task.stats.avg_duration_ms = (
-                        task.stats.avg_duration_ms * 0.9 + duration_ms * 0.1
-                    )
-                
-                if task.stats.run_count % 10 == 1:  # Log every 10th run
-                    logger.info(
-                        f"Task {task.name} completed: duration={duration_ms:.1f}ms, drift={drift_ms:.1f}ms, runs={task.stats.run_count}"
-                    )
-                
-            finally:
-                self._semaphore.release()
-                
+            task.callback()
+
+            # Update stats on success
+            duration_ms = (time.monotonic() - start_mono) * 1000
+
+            run_count = self._stat_run_count[idx] + 1
+            self._stat_run_count[idx] = run_count
+            self._stat_last_run[idx] = start_time
+            self._stat_drift_ms[idx] = drift_ms
+            self._stat_failures[idx] = 0
+
+            # Update average duration
+            avg_ms = self._stat_avg_ms[idx]
+            if avg_ms == 0:
+                self._stat_avg_ms[idx] = duration_ms
+            else:
+                self._stat_avg_ms[idx] = avg_ms * 0.9 + duration_ms * 0.1
+
+            if run_count % 10 == 1:  # Log every 10th run
+                logger.info(
+                    "Task %s completed: duration=%.1fms, drift=%.1fms, runs=%d",
+                    task.name, duration_ms, drift_ms, run_count,
+                )
+
         except Exception as e:
-            task.stats.error_count += 1
-            task.stats.consecutive_failures += 1
-            import traceback
-            logger.error(f"Task {task.name} failed: {e}\n{traceback.format_exc()}")
-        
+            self._stat_error_count[idx] += 1
+            self._stat_failures[idx] += 1
+            # exception() defers traceback formatting to the handler,
+            # so a filtered-out record costs nothing
+            logger.exception("Task %s failed: %s", task.name, e)
+
         finally:
-            # Schedule next run
+            # Schedule next run anchored to the previous slot so task
+            # duration does not accumulate into the cadence; if we fell
+            # more than one interval behind, skip the missed slots.
             with task._lock:
                 task._running = False
                 task.state = TaskState.PENDING
-                task._next_run = time.time() + task.interval
-                task.stats.next_run = task._next_run
+                now_mono = time.monotonic()
+                task._next_run += task.interval
+                if task._next_run <= now_mono:
+                    task._next_run = now_mono + task.interval
+                # Wall-clock projection for stats consumers
+                self._stat_next_run[idx] = time.time() + (task._next_run - now_mono)
+            with self._lock:
+                if task.name in self._tasks:
+                    self._push_task(task)
     
     def is_running(self) -> bool:
         """Check if scheduler is running."""
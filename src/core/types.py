@@ -9,8 +9,22 @@ This module defines the fundamental data structures used throughout the system:
 from dataclasses import dataclass, field, asdict
 from enum import Enum, auto
 from typing import Any
+import threading
 import time
 
+# Per-thread free lists for Event/SensorReading reuse; thread-local so
+# acquire/release never need a lock.
+_POOL_MAX = 1024
+_pools = threading.local()
+
+
+def _get_pool(name: str) -> list:
+    pool = getattr(_pools, name, None)
+    if pool is None:
+        pool = []
+        setattr(_pools, name, pool)
+    return pool
+
 
 class EventType(str, Enum):
     """Types of events in the system."""
@@ -21,6 +35,11 @@ class EventType(str, Enum):
     ALERT = "alert"         # Alert notification
 
 
+# One bit per event type; lets subscribers match types with a single
+# integer AND instead of a set lookup.
+_EVENT_TYPE_BIT = {event_type: 1 << i for i, event_type in enumerate(EventType)}
+
+
 class SensorStatus(str, Enum):
     """Status of a sensor."""
     RUNNING = "running"
@@ -37,6 +56,11 @@ class Priority(str, Enum):
     LOW = "low"
 
 
+# Priority ordering for schedulers/sorters; int compares are far
+# cheaper than hashing the enum's string value in hot loops.
+_PRIORITY_RANK = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+
+
 class Severity(str, Enum):
     """Severity levels for events and alerts."""
     INFO = "info"
@@ -44,7 +68,11 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Severity ordering used by filters and alert routing.
+_SEVERITY_RANK = {Severity.INFO: 0, Severity.WARNING: 1, Severity.CRITICAL: 2}
+
+
+@dataclass(slots=True)
 class Event:
     """Event passed through the Event Bus.
     
@@ -62,13 +90,37 @@ class Event:
     payload: dict[str, Any]
     severity: Severity = Severity.INFO
     metadata: dict[str, Any] | None = None
-    
+    _numeric_items: tuple[tuple[str, float], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    type_bit: int = field(default=0, init=False, repr=False, compare=False)
+    _sev_rank: int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate and convert event_type if needed."""
         if isinstance(self.event_type, str):
             self.event_type = EventType(self.event_type)
         if isinstance(self.severity, str):
             self.severity = Severity(self.severity)
+        self.type_bit = _EVENT_TYPE_BIT[self.event_type]
+        # Rank resolved once here so every filter compares plain ints
+        self._sev_rank = _SEVERITY_RANK[self.severity]
+
+    def numeric_items(self) -> tuple[tuple[str, float], ...]:
+        """Numeric payload entries as (key, float) pairs.
+
+        Computed once on first use and cached, so every consumer of the
+        event shares one type-checked projection of the payload.
+        """
+        items = self._numeric_items
+        if items is None:
+            items = tuple(
+                (key, float(value))
+                for key, value in self.payload.items()
+                if isinstance(value, (int, float))
+            )
+            self._numeric_items = items
+        return items
     
     @classmethod
     def create(
@@ -89,6 +141,47 @@ class Event:
             metadata=metadata
         )
     
+    @classmethod
+    def acquire(
+        cls,
+        source: str,
+        event_type: EventType | str,
+        payload: dict[str, Any],
+        severity: Severity | str = Severity.INFO,
+        metadata: dict[str, Any] | None = None
+    ) -> "Event":
+        """Like create(), but reuses an instance released to the pool.
+
+        High-rate publishers that own their events end to end can pair
+        acquire()/release() to avoid allocating an Event per tick.
+        Callers that hand events to subscribers which retain them must
+        not release and should keep using create().
+        """
+        pool = _get_pool("events")
+        if not pool:
+            return cls.create(source, event_type, payload, severity, metadata)
+        event = pool.pop()
+        event.timestamp = time.time()
+        event.source = source
+        event.event_type = event_type if isinstance(event_type, EventType) else EventType(event_type)
+        event.payload = payload
+        event.severity = severity if isinstance(severity, Severity) else Severity(severity)
+        event.metadata = metadata
+        event._numeric_items = None
+        event.type_bit = _EVENT_TYPE_BIT[event.event_type]
+        event._sev_rank = _SEVERITY_RANK[event.severity]
+        return event
+
+    @classmethod
+    def release(cls, event: "Event") -> None:
+        """Return an event to the pool once no consumer references it."""
+        event.payload = {}
+        event.metadata = None
+        event._numeric_items = None
+        pool = _get_pool("events")
+        if len(pool) < _POOL_MAX:
+            pool.append(event)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary for serialization."""
         result = {
@@ -115,7 +208,14 @@ class Event:
         )
 
 
-@dataclass
+# Per-source serialization plans for SensorReading.to_dict: the key set
+# of a sensor's readings is stable, so the reserved-key scan is done once
+# per (source, key set) and reduces to a dict merge afterwards.
+_RESERVED_KEYS = frozenset({"timestamp", "source", "_metadata"})
+_RENAME_CACHE: dict[str, tuple[frozenset, dict[str, str] | None]] = {}
+
+
+@dataclass(slots=True)
 class SensorReading:
     """Data collected by a sensor.
     
@@ -145,23 +245,55 @@ class SensorReading:
             metadata=metadata
         )
     
+    @classmethod
+    def acquire(
+        cls,
+        source: str,
+        data: dict[str, Any],
+        metadata: dict[str, Any] | None = None
+    ) -> "SensorReading":
+        """Like create(), but reuses an instance released to the pool."""
+        pool = _get_pool("readings")
+        if not pool:
+            return cls.create(source, data, metadata)
+        reading = pool.pop()
+        reading.timestamp = time.time()
+        reading.source = source
+        reading.data = data
+        reading.metadata = metadata
+        return reading
+
+    @classmethod
+    def release(cls, reading: "SensorReading") -> None:
+        """Return a reading to the pool once no consumer references it."""
+        reading.data = {}
+        reading.metadata = None
+        pool = _get_pool("readings")
+        if len(pool) < _POOL_MAX:
+            pool.append(reading)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert reading to dictionary for serialization.
-        
+
         Note: Reserved keys (timestamp, source, _metadata) in data are prefixed
         with 'data_' to avoid conflicts.
         """
-        result = {
-            "timestamp": self.timestamp,
-            "source": self.source,
-        }
-        # Add data fields, prefixing reserved keys to avoid conflicts
-        reserved_keys = {"timestamp", "source", "_metadata"}
-        for key, value in self.data.items():
-            if key in reserved_keys:
-                result[f"data_{key}"] = value
-            else:
-                result[key] = value
+        data = self.data
+        plan = _RENAME_CACHE.get(self.source)
+        if plan is None or plan[0] != data.keys():
+            # First reading from this source (or a schema change):
+            # compute which keys collide with the reserved ones.
+            renames = {key: f"data_{key}" for key in data.keys() & _RESERVED_KEYS} or None
+            plan = (frozenset(data), renames)
+            _RENAME_CACHE[self.source] = plan
+        renames = plan[1]
+        if renames is None:
+            # Common case: no collisions, single C-level merge
+            result = {"timestamp": self.timestamp, "source": self.source, **data}
+        else:
+            result = {"timestamp": self.timestamp, "source": self.source}
+            for key, value in data.items():
+                result[renames.get(key, key)] = value
         if self.metadata:
             result["_metadata"] = self.metadata
         return result
@@ -206,7 +338,7 @@ class SensorReading:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyEvent:
     """Detected anomaly event.
     
@@ -270,7 +402,7 @@ class AnomalyEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStats:
     """Statistics for a scheduled task.
     
@@ -7,13 +7,23 @@ import asyncio
 import hashlib
 import json
 import logging
+import random
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+
+    def _json_serialize(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_serialize = json.dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +45,31 @@ class AlertPriority(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Built once at import; the per-alert paths compare ints and look up
+# prebuilt maps instead of rebuilding lists/dicts per call.
+_PRIORITY_RANK = {
+    AlertPriority.LOW: 0,
+    AlertPriority.MEDIUM: 1,
+    AlertPriority.HIGH: 2,
+    AlertPriority.CRITICAL: 3,
+}
+
+_PRIORITY_EMOJI = {
+    AlertPriority.LOW: "ℹ️",
+    AlertPriority.MEDIUM: "⚠️",
+    AlertPriority.HIGH: "🔴",
+    AlertPriority.CRITICAL: "🚨"
+}
+
+_PRIORITY_COLOR = {
+    AlertPriority.LOW: 0x3498db,      # Blue
+    AlertPriority.MEDIUM: 0xf39c12,   # Orange
+    AlertPriority.HIGH: 0xe74c3c,     # Red
+    AlertPriority.CRITICAL: 0x9b59b6  # Purple
+}
+
+
+@dataclass(slots=True)
 class Alert:
     """Alert data structure."""
     alert_type: AlertType
@@ -44,19 +78,42 @@ class Alert:
     message: str
     data: dict[str, Any] | None = None
     timestamp: float | None = None
-    
+    _cached_id: str | None = field(default=None, init=False, repr=False, compare=False)
+    _iso_timestamp: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Enum .value reads resolved once; the send path touches these
+    # several times per alert
+    type_value: str = field(default="", init=False, repr=False, compare=False)
+    priority_value: str = field(default="", init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time.time()
-    
+        self.type_value = self.alert_type.value
+        self.priority_value = self.priority.value
+
+    @property
+    def iso_timestamp(self) -> str:
+        """ISO-8601 UTC timestamp string, formatted once per alert."""
+        cached = self._iso_timestamp
+        if cached is None:
+            cached = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.timestamp))
+            self._iso_timestamp = cached
+        return cached
+
     @property
     def alert_id(self) -> str:
-        """Generate unique ID for deduplication."""
-        content = f"{self.alert_type.value}:{self.title}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        """Generate unique ID for deduplication (computed once)."""
+        cached = self._cached_id
+        if cached is None:
+            content = f"{self.type_value}:{self.title}"
+            # blake2b is faster than md5 and emits the 12 hex chars we
+            # want directly instead of truncating a 32-char digest
+            cached = hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
+            self._cached_id = cached
+        return cached
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookConfig:
     """Webhook configuration."""
     url: str
@@ -64,6 +121,103 @@ class WebhookConfig:
     enabled: bool = True
 
 
+# requests/second and burst capacity per platform; Discord allows ~5
+# req/s per webhook, Slack about 1
+_PLATFORM_RATES = {
+    "discord": (5.0, 5),
+    "slack": (1.0, 1),
+    "telegram": (1.0, 1),
+}
+
+
+class _TokenBucket:
+    """Async token bucket: acquire() sleeps until a token is available."""
+
+    __slots__ = ("rate", "capacity", "_tokens", "_last")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+def _format_discord(alert: Alert, emoji: str) -> dict[str, Any]:
+    """Discord embed payload."""
+    return {
+        "embeds": [{
+            "title": f"{emoji} {alert.title}",
+            "description": alert.message,
+            "color": _PRIORITY_COLOR.get(alert.priority, 0x95a5a6),
+            "fields": [
+                {"name": "Type", "value": alert.type_value, "inline": True},
+                {"name": "Priority", "value": alert.priority_value, "inline": True}
+            ],
+            "timestamp": alert.iso_timestamp
+        }]
+    }
+
+
+def _format_slack(alert: Alert, emoji: str) -> dict[str, Any]:
+    """Slack blocks payload."""
+    return {
+        "blocks": [
+            {
+                "type": "header",
+                "text": {"type": "plain_text", "text": f"{emoji} {alert.title}"}
+            },
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": alert.message}
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {"type": "mrkdwn", "text": f"*Type:* {alert.type_value}"},
+                    {"type": "mrkdwn", "text": f"*Priority:* {alert.priority_value}"}
+                ]
+            }
+        ]
+    }
+
+
+def _format_telegram(alert: Alert, emoji: str) -> dict[str, Any]:
+    """Telegram text payload (chat_id lives in the URL)."""
+    text = f"{emoji} *{alert.title}*\n\n{alert.message}\n\n_Type: {alert.type_value} | Priority: {alert.priority_value}_"
+    return {"text": text, "parse_mode": "Markdown"}
+
+
+def _format_generic(alert: Alert, emoji: str) -> dict[str, Any]:
+    """Generic JSON payload for unknown platforms."""
+    return {
+        "title": alert.title,
+        "message": alert.message,
+        "type": alert.type_value,
+        "priority": alert.priority_value,
+        "timestamp": alert.timestamp
+    }
+
+
+# Platform dispatch; known platforms skip the branch chain entirely
+_FORMATTERS = {
+    "discord": _format_discord,
+    "slack": _format_slack,
+    "telegram": _format_telegram,
+}
+
+
 class AlertingSystem:
     """System for sending alerts via webhooks.
     
@@ -87,21 +241,136 @@ class AlertingSystem:
     def __init__(
         self,
         cooldown_seconds: float = 300.0,
-        min_priority: AlertPriority = AlertPriority.LOW
+        min_priority: AlertPriority = AlertPriority.LOW,
+        batch_interval: float = 0.0,
+        max_batch: int = 10
     ):
         """Initialize alerting system.
-        
+
         Args:
             cooldown_seconds: Cooldown between duplicate alerts
             min_priority: Minimum priority to send alerts
+            batch_interval: When > 0, alerts are coalesced for up to
+                this many seconds and sent as one POST per webhook
+            max_batch: Maximum alerts per batch (Discord allows 10
+                embeds per message)
         """
         self.cooldown_seconds = cooldown_seconds
         self.min_priority = min_priority
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
         
         self._webhooks: list[WebhookConfig] = []
-        self._last_alerts: dict[str, float] = {}  # alert_id -> timestamp
+        # Webhooks grouped by platform at registration time, so the
+        # send path formats once per platform and fans out per group
+        self._by_platform: dict[str, list[WebhookConfig]] = {}
+        # alert_id -> timestamp, insertion-ordered so it can double as
+        # an LRU: a stream of distinct titles arriving faster than the
+        # time-based sweep is capped by evicting the oldest entries
+        self._last_alerts: OrderedDict[str, float] = OrderedDict()
+        self._max_tracked = 10_000
+        # Send order; cleanup sweeps expired ids off the left instead
+        # of rebuilding _last_alerts per alert
+        self._alert_order: deque[tuple[float, str]] = deque()
         self._alert_count = 0
         self._suppressed_count = 0
+        # One session per application, created lazily: reusing its
+        # keep-alive connections turns each alert into a single HTTP
+        # round trip instead of a fresh TCP/TLS handshake per webhook.
+        self._session: aiohttp.ClientSession | None = None
+        # Shared by every request the session makes, and across session
+        # recreations
+        self._timeout = aiohttp.ClientTimeout(total=10)
+        # Batching mode: send_alert enqueues and a background task
+        # drains bursts into one POST per webhook
+        self._queue: asyncio.Queue[Alert] | None = None
+        self._drain_task: asyncio.Task | None = None
+        # Per-platform token buckets so bursts queue client-side
+        # instead of being 429'd by the server
+        self._limiters: dict[str, _TokenBucket] = {}
+        # Fire-and-forget ingestion: enqueue() hands the alert to a
+        # background worker so hot paths never await webhook I/O
+        self._pending: asyncio.Queue[Alert] | None = None
+        self._worker_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the background delivery worker.
+
+        Optional: send_alert stays usable directly; after start(),
+        enqueue() offers a non-blocking entry point for hot paths.
+        """
+        if self._worker_task is not None and not self._worker_task.done():
+            return
+        if self._pending is None:
+            self._pending = asyncio.Queue(maxsize=1000)
+        self._worker_task = asyncio.get_running_loop().create_task(self._worker())
+
+    def enqueue(self, alert: Alert) -> bool:
+        """Queue an alert for background delivery without awaiting.
+
+        Returns:
+            True if the alert was queued, False if the worker is not
+            running or the queue is full (counted as suppressed).
+        """
+        if self._pending is None:
+            logger.warning("enqueue() called before start(); alert dropped")
+            return False
+        try:
+            self._pending.put_nowait(alert)
+        except asyncio.QueueFull:
+            self._suppressed_count += 1
+            return False
+        return True
+
+    async def _worker(self) -> None:
+        """Drain the pending queue through the normal send path."""
+        queue = self._pending
+        while True:
+            alert = await queue.get()
+            try:
+                await self.send_alert(alert)
+            except Exception:
+                logger.exception("Alert delivery failed: %s", alert.title)
+            finally:
+                queue.task_done()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
+                timeout=self._timeout,
+                # C-level encoder for the nested embeds/blocks payloads
+                json_serialize=_json_serialize,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session and its pooled connections."""
+        if self._worker_task is not None:
+            if self._pending is not None:
+                await self._pending.join()
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     def add_webhook(self, url: str, platform: str, enabled: bool = True) -> None:
         """Add a webhook endpoint.
@@ -111,36 +380,41 @@ class AlertingSystem:
             platform: Platform type (discord, telegram, slack)
             enabled: Whether webhook is enabled
         """
-        self._webhooks.append(WebhookConfig(url=url, platform=platform, enabled=enabled))
+        webhook = WebhookConfig(url=url, platform=platform, enabled=enabled)
+        self._webhooks.append(webhook)
+        self._by_platform.setdefault(platform, []).append(webhook)
         logger.info(f"Added {platform} webhook")
-    
+
     def remove_webhook(self, url: str) -> None:
         """Remove a webhook endpoint.
-        
+
         Args:
             url: Webhook URL to remove
         """
         self._webhooks = [w for w in self._webhooks if w.url != url]
+        self._by_platform = {}
+        for webhook in self._webhooks:
+            self._by_platform.setdefault(webhook.platform, []).append(webhook)
     
-    def _should_send(self, alert: Alert) -> bool:
+    def _should_send(self, alert: Alert, now: float) -> bool:
         """Check if alert should be sent.
-        
+
         Args:
             alert: Alert to check
-            
+            now: Current timestamp (taken once per send_alert call)
+
         Returns:
             True if alert should be sent
         """
         # Check priority
-        priority_order = [AlertPriority.LOW, AlertPriority.MEDIUM, AlertPriority.HIGH, AlertPriority.CRITICAL]
-        if priority_order.index(alert.priority) < priority_order.index(self.min_priority):
+        if _PRIORITY_RANK[alert.priority] < _PRIORITY_RANK[self.min_priority]:
             return False
-        
+
         # Check cooldown
         alert_id = alert.alert_id
         last_time = self._last_alerts.get(alert_id)
-        
-        if last_time and (time.time() - last_time) < self.cooldown_seconds:
+
+        if last_time and (now - last_time) < self.cooldown_seconds:
             self._suppressed_count += 1
             logger.debug(f"Alert suppressed (cooldown): {alert.title}")
             return False
@@ -156,129 +430,194 @@ class AlertingSystem:
         Returns:
             True if sent successfully to at least one webhook
         """
-        if not self._should_send(alert):
+        now = time.time()
+        if not self._should_send(alert, now):
             return False
-        
+
         if not self._webhooks:
             logger.warning("No webhooks configured")
             return False
-        
+
         # Update last alert time
-        self._last_alerts[alert.alert_id] = time.time()
+        last_alerts = self._last_alerts
+        last_alerts[alert.alert_id] = now
+        last_alerts.move_to_end(alert.alert_id)
+        while len(last_alerts) > self._max_tracked:
+            last_alerts.popitem(last=False)
+        self._alert_order.append((now, alert.alert_id))
         self._alert_count += 1
+
+        # Clean old entries every 64 alerts; the sweep itself is
+        # amortized O(1) per alert
+        if self._alert_count & 0x3F == 0:
+            self._cleanup_old_alerts()
         
-        # Clean old entries
-        self._cleanup_old_alerts()
-        
-        success = False
-        async with aiohttp.ClientSession() as session:
-            for webhook in self._webhooks:
-                if not webhook.enabled:
-                    continue
-                
+        if self.batch_interval > 0:
+            # Coalesce bursts: the drain task turns up to max_batch
+            # queued alerts into one POST per webhook
+            if self._queue is None:
+                self._queue = asyncio.Queue()
+            if self._drain_task is None or self._drain_task.done():
+                self._drain_task = asyncio.get_running_loop().create_task(
+                    self._drain_loop()
+                )
+            self._queue.put_nowait(alert)
+            return True
+
+        return await self._send_batch([alert])
+
+    async def _drain_loop(self) -> None:
+        """Drain queued alerts into batched webhook sends."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Collect follow-up alerts for up to batch_interval seconds
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    payload = self._format_payload(alert, webhook.platform)
-                    async with session.post(
-                        webhook.url,
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        if response.status in (200, 204):
-                            success = True
-                            logger.info(f"Alert sent to {webhook.platform}: {alert.title}")
-                        else:
-                            logger.warning(f"Webhook returned {response.status}")
-                except Exception as e:
-                    logger.error(f"Failed to send to {webhook.platform}: {e}")
-        
-        return success
-    
-    def _format_payload(self, alert: Alert, platform: str) -> dict[str, Any]:
-        """Format alert payload for specific platform.
-        
-        Args:
-            alert: Alert to format
-            platform: Target platform
-            
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                logger.error(f"Batch send failed: {e}")
+
+    async def _send_batch(self, alerts: list[Alert]) -> bool:
+        """Send a batch of alerts to all enabled webhooks.
+
         Returns:
-            Formatted payload dictionary
+            True if at least one webhook accepted the batch
         """
-        # Priority emoji
-        priority_emoji = {
-            AlertPriority.LOW: "ℹ️",
-            AlertPriority.MEDIUM: "⚠️",
-            AlertPriority.HIGH: "🔴",
-            AlertPriority.CRITICAL: "🚨"
-        }
-        emoji = priority_emoji.get(alert.priority, "📢")
-        
+        session = await self._get_session()
+        title = alerts[0].title if len(alerts) == 1 else f"{len(alerts)} alerts"
+        # One payload per platform group, fanned out to its webhooks;
+        # all round trips overlap instead of serializing
+        tasks = []
+        targets = []
+        for platform, group in self._by_platform.items():
+            payload: dict[str, Any] | None = None
+            for webhook in group:
+                if not webhook.enabled:
+                    continue
+                if payload is None:
+                    payload = self._format_batch_payload(alerts, platform)
+                tasks.append(self._post_one(session, webhook, payload, title))
+                targets.append(webhook)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for webhook, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to send to {webhook.platform}: {result}")
+        return any(result is True for result in results)
+
+    async def _post_one(
+        self,
+        session: aiohttp.ClientSession,
+        webhook: WebhookConfig,
+        payload: dict[str, Any],
+        title: str,
+    ) -> bool:
+        """POST a payload to one webhook, returning delivery success.
+
+        Retries up to three attempts: 429 honors the Retry-After
+        header, 5xx and connection errors back off exponentially with
+        jitter, and other 4xx responses fail immediately.
+        """
+        bucket = self._limiters.get(webhook.platform)
+        if bucket is None:
+            rate, capacity = _PLATFORM_RATES.get(webhook.platform, (5.0, 5))
+            bucket = self._limiters[webhook.platform] = _TokenBucket(rate, capacity)
+
+        for attempt in range(3):
+            await bucket.acquire()
+            try:
+                async with session.post(webhook.url, json=payload) as response:
+                    status = response.status
+                    if status in (200, 204):
+                        logger.info(f"Alert sent to {webhook.platform}: {title}")
+                        return True
+                    if status == 429:
+                        retry_after = float(response.headers.get("Retry-After", 1))
+                        logger.warning(
+                            f"{webhook.platform} rate limited, retrying in {retry_after}s"
+                        )
+                        await asyncio.sleep(retry_after)
+                        continue
+                    if status >= 500:
+                        logger.warning(f"Webhook returned {status}, retrying")
+                        await asyncio.sleep((2 ** attempt) * 0.5 + random.random() * 0.2)
+                        continue
+                    logger.warning(f"Webhook returned {status}")
+                    return False
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == 2:
+                    raise
+                await asyncio.sleep((2 ** attempt) * 0.5 + random.random() * 0.2)
+
+        logger.warning(f"Giving up on {webhook.platform} after 3 attempts")
+        return False
+
+    def _format_batch_payload(
+        self, alerts: list[Alert], platform: str
+    ) -> dict[str, Any]:
+        """Combine several alerts into one payload for a platform."""
+        if len(alerts) == 1:
+            return self._format_payload(alerts[0], platform)
+
         if platform == "discord":
             return {
-                "embeds": [{
-                    "title": f"{emoji} {alert.title}",
-                    "description": alert.message,
-                    "color": self._get_color(alert.priority),
-                    "fields": [
-                        {"name": "Type", "value": alert.alert_type.value, "inline": True},
-                        {"name": "Priority", "value": alert.priority.value, "inline": True}
-                    ],
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(alert.timestamp))
-                }]
-            }
-        
-        elif platform == "slack":
-            return {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {"type": "plain_text", "text": f"{emoji} {alert.title}"}
-                    },
-                    {
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": alert.message}
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {"type": "mrkdwn", "text": f"*Type:* {alert.alert_type.value}"},
-                            {"type": "mrkdwn", "text": f"*Priority:* {alert.priority.value}"}
-                        ]
-                    }
+                "embeds": [
+                    embed
+                    for alert in alerts
+                    for embed in self._format_payload(alert, "discord")["embeds"]
                 ]
             }
-        
+        elif platform == "slack":
+            blocks = []
+            for alert in alerts:
+                blocks.extend(self._format_payload(alert, "slack")["blocks"])
+            return {"blocks": blocks}
         elif platform == "telegram":
-            # Telegram uses chat_id in URL, just send text
-            text = f"{emoji} *{alert.title}*\n\n{alert.message}\n\n_Type: {alert.alert_type.value} | Priority: {alert.priority.value}_"
+            text = "\n\n".join(
+                self._format_payload(alert, "telegram")["text"] for alert in alerts
+            )
             return {"text": text, "parse_mode": "Markdown"}
-        
         else:
-            # Generic JSON
-            return {
-                "title": alert.title,
-                "message": alert.message,
-                "type": alert.alert_type.value,
-                "priority": alert.priority.value,
-                "timestamp": alert.timestamp
-            }
+            return {"alerts": [self._format_payload(a, platform) for a in alerts]}
     
+    def _format_payload(self, alert: Alert, platform: str) -> dict[str, Any]:
+        """Format alert payload for specific platform.
+
+        Args:
+            alert: Alert to format
+            platform: Target platform
+
+        Returns:
+            Formatted payload dictionary
+        """
+        emoji = _PRIORITY_EMOJI.get(alert.priority, "📢")
+        return _FORMATTERS.get(platform, _format_generic)(alert, emoji)
+
     def _get_color(self, priority: AlertPriority) -> int:
         """Get Discord embed color for priority."""
-        colors = {
-            AlertPriority.LOW: 0x3498db,      # Blue
-            AlertPriority.MEDIUM: 0xf39c12,   # Orange
-            AlertPriority.HIGH: 0xe74c3c,     # Red
-            AlertPriority.CRITICAL: 0x9b59b6  # Purple
-        }
-        return colors.get(priority, 0x95a5a6)
+        return _PRIORITY_COLOR.get(priority, 0x95a5a6)
     
     def _cleanup_old_alerts(self) -> None:
-        """Remove old alert entries to prevent memory growth."""
+        """Remove old alert entries to prevent memory growth.
+
+        Entries are swept in send order off the left of _alert_order;
+        an id is only dropped from _last_alerts if its timestamp still
+        matches, so a resent alert's fresher entry survives.
+        """
         cutoff = time.time() - self.cooldown_seconds * 2
-        self._last_alerts = {
-            k: v for k, v in self._last_alerts.items()
-            if v > cutoff
-        }
+        order = self._alert_order
+        while order and order[0][0] <= cutoff:
+            sent_at, alert_id = order.popleft()
+            if self._last_alerts.get(alert_id) == sent_at:
+                del self._last_alerts[alert_id]
     
     def get_stats(self) -> dict[str, Any]:
         """Get alerting statistics.
@@ -11,6 +11,11 @@ from typing import Any
 
 import numpy as np
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised without orjson installed
+    _json_loads = json.loads
+
 from .calibration_tracker import get_tracker
 
 logger = logging.getLogger(__name__)
@@ -54,6 +59,9 @@ class AutoCalibrator:
         self._tracker = get_tracker()
         self._last_calibration_check = 0
         self._calibration_history: list[dict] = []
+        # Legacy hits file names keyed on (mtime, size): the file is
+        # frozen history, so the O(N) scan runs at most once
+        self._legacy_names_cache: tuple[float, int, frozenset[str]] | None = None
         
         # Load calibration history
         self._load_history()
@@ -188,16 +196,26 @@ class AutoCalibrator:
             "crypto.ETHUSDT.price.change_pct",
         ]
         
-        # Get all thresholds from logs
-        all_thresholds = set()
+        # The tracker's name index covers everything logged since
+        # sharding; the legacy monolithic file is scanned only for
+        # names that predate it.
+        all_thresholds = self._tracker.known_threshold_names()
         hits_file = self.calibration_dir / "threshold_hits.jsonl"
-        
+
         if hits_file.exists():
             try:
-                with open(hits_file, "r") as f:
-                    for line in f:
-                        record = json.loads(line)
-                        all_thresholds.add(record["threshold_name"])
+                st = hits_file.stat()
+                cache = self._legacy_names_cache
+                if cache is not None and cache[:2] == (st.st_mtime, st.st_size):
+                    all_thresholds |= cache[2]
+                else:
+                    legacy_names = set()
+                    with open(hits_file, "rb") as f:
+                        for line in f:
+                            record = _json_loads(line)
+                            legacy_names.add(record["threshold_name"])
+                    self._legacy_names_cache = (st.st_mtime, st.st_size, frozenset(legacy_names))
+                    all_thresholds |= legacy_names
             except Exception as e:
                 logger.error(f"Failed to read threshold hits: {e}")
         
@@ -3,14 +3,47 @@
 Logs all threshold checks to enable data-driven calibration.
 """
 
+import atexit
 import json
 import logging
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import numpy as np
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised without orjson installed
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+try:
+    from tdigest import TDigest
+except ImportError:  # pragma: no cover - optional streaming accelerator
+    TDigest = None
 
 logger = logging.getLogger(__name__)
 
+# Fixed-width on-disk rows for the hot logs: 25 bytes per check versus
+# ~200 bytes of ASCII JSON, and analysis reads them back with a single
+# np.fromfile instead of parsing every record.
+_HIT_DTYPE = np.dtype([
+    ("ts", "<f8"),
+    ("value", "<f8"),
+    ("threshold", "<f8"),
+    ("triggered", "<u1"),
+])
+_VALUE_DTYPE = np.dtype([("ts", "<f8"), ("value", "<f8")])
+
 
 class CalibrationTracker:
     """Tracks threshold hits for calibration purposes."""
@@ -27,12 +60,115 @@ class CalibrationTracker:
         self.threshold_hits_file = self.log_dir / "threshold_hits.jsonl"
         self.value_distributions_file = self.log_dir / "value_distributions.jsonl"
         self.metadata_file = self.log_dir / "tracker_metadata.json"
-        
+
+        # Per-threshold shard files: analyzing one threshold reads only
+        # its own log instead of filtering the monolithic file. The
+        # legacy monolithic file is still read for pre-shard history.
+        self.hits_dir = self.log_dir / "hits"
+        self.hits_dir.mkdir(parents=True, exist_ok=True)
+        self.values_dir = self.log_dir / "values"
+        self.values_dir.mkdir(parents=True, exist_ok=True)
+        self.names_file = self.log_dir / "threshold_names.txt"
+        self._known_names = self._load_known_names()
+
+        # Persistent append handles: one open() per log file for the
+        # process lifetime instead of per record, with the 64 KiB
+        # userspace buffer coalescing writes. Flushed every
+        # _FLUSH_EVERY records, before reads, and at exit.
+        self._write_fps: dict[Path, BinaryIO] = {}
+        self._writes_since_flush = 0
+        atexit.register(self.close)
+
+        # Streaming quantile sketches (optional, needs tdigest): O(1)
+        # percentile queries over this process's checks with bounded
+        # memory, for live views that cannot afford a shard scan.
+        # Exact calibration still reads the shards.
+        self._digests: dict[str, Any] = {}
+        self._digest_stats: dict[str, list[int]] = {}
+
+        # Memoized analyses keyed on (name, shard size): quantiles only
+        # change when new rows land, so repeated calibration passes over
+        # unchanged data skip the scan entirely. LRU-bounded.
+        self._analysis_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+
         # Load or initialize start time
         self._start_time = self._load_start_time()
         self._hit_count = 0
         self._value_count = 0
+
+    _FLUSH_EVERY = 256
+    _ANALYSIS_CACHE_MAX = 128
+
+    def _append(self, path: Path, data: bytes) -> None:
+        """Append bytes to a log file through its persistent handle."""
+        fp = self._write_fps.get(path)
+        if fp is None:
+            fp = open(path, "ab", buffering=1 << 16)
+            self._write_fps[path] = fp
+        fp.write(data)
+        self._writes_since_flush += 1
+        if self._writes_since_flush >= self._FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered log writes to disk."""
+        self._writes_since_flush = 0
+        for fp in self._write_fps.values():
+            try:
+                fp.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush calibration log: {e}")
+
+    def close(self) -> None:
+        """Flush and close all persistent log handles."""
+        self.flush()
+        for fp in self._write_fps.values():
+            try:
+                fp.close()
+            except Exception:
+                pass
+        self._write_fps.clear()
     
+    def _load_known_names(self) -> set[str]:
+        """Load the set of threshold names seen so far."""
+        try:
+            with open(self.names_file, "r") as f:
+                return {line.strip() for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.warning(f"Failed to load threshold names index: {e}")
+            return set()
+
+    def _record_name(self, threshold_name: str) -> None:
+        """Append a newly seen threshold name to the on-disk index."""
+        self._known_names.add(threshold_name)
+        try:
+            with open(self.names_file, "a") as f:
+                f.write(threshold_name + "\n")
+        except Exception as e:
+            logger.error(f"Failed to update threshold names index: {e}")
+
+    def _shard_path(self, threshold_name: str) -> Path:
+        """Return the per-threshold JSONL hits file (legacy era)."""
+        return self.hits_dir / (threshold_name.replace("/", "_") + ".jsonl")
+
+    def _hit_bin_path(self, threshold_name: str) -> Path:
+        """Return the per-threshold binary column file."""
+        return self.hits_dir / (threshold_name.replace("/", "_") + ".bin")
+
+    def _hit_meta_path(self, threshold_name: str) -> Path:
+        """Return the per-threshold audit log for triggered checks."""
+        return self.hits_dir / (threshold_name.replace("/", "_") + ".meta.jsonl")
+
+    def _value_bin_path(self, parameter_name: str) -> Path:
+        """Return the per-parameter binary column file."""
+        return self.values_dir / (parameter_name.replace("/", "_") + ".bin")
+
+    def known_threshold_names(self) -> set[str]:
+        """Return all threshold names seen by this tracker."""
+        return set(self._known_names)
+
     def _load_start_time(self) -> float:
         """Load start time from disk or initialize new one."""
         if self.metadata_file.exists():
@@ -76,25 +212,66 @@ class CalibrationTracker:
             value: Actual value
             threshold_value: Threshold value
             triggered: Whether threshold was triggered
-            metadata: Additional context
+            metadata: Additional context (persisted only for triggered
+                checks, in the per-threshold audit log)
         """
-        record = {
-            "timestamp": time.time(),
-            "threshold_name": threshold_name,
-            "value": value,
-            "threshold_value": threshold_value,
-            "triggered": triggered,
-            "metadata": metadata or {}
-        }
-        
+        ts = time.time()
+
         try:
-            with open(self.threshold_hits_file, "a") as f:
-                f.write(json.dumps(record) + "\n")
-            
+            row = np.array([(ts, value, threshold_value, triggered)], dtype=_HIT_DTYPE)
+            self._append(self._hit_bin_path(threshold_name), row.tobytes())
+
+            # Triggers are rare by design; keep their context for
+            # forensics without paying JSON per sampled check
+            if triggered and metadata:
+                record = {
+                    "timestamp": ts,
+                    "threshold_name": threshold_name,
+                    "value": value,
+                    "threshold_value": threshold_value,
+                    "metadata": metadata
+                }
+                self._append(self._hit_meta_path(threshold_name), _json_dumps(record) + b"\n")
+
+            if TDigest is not None:
+                digest = self._digests.get(threshold_name)
+                if digest is None:
+                    digest = self._digests[threshold_name] = TDigest()
+                    self._digest_stats[threshold_name] = [0, 0]
+                digest.update(value)
+                stats = self._digest_stats[threshold_name]
+                stats[0] += 1
+                stats[1] += triggered
+
+            if threshold_name not in self._known_names:
+                self._record_name(threshold_name)
             if triggered:
                 self._hit_count += 1
         except Exception as e:
             logger.error(f"Failed to log threshold check: {e}")
+
+    def streaming_stats(self, threshold_name: str) -> dict[str, Any] | None:
+        """Return approximate percentiles from the in-process sketch.
+
+        O(1) per query and bounded memory, but covers only checks
+        logged since this process started; exact, full-history numbers
+        come from analyze_threshold. Returns None when tdigest is not
+        installed or no checks have been seen for the threshold.
+        """
+        digest = self._digests.get(threshold_name)
+        if digest is None:
+            return None
+        checks, triggered = self._digest_stats[threshold_name]
+        return {
+            "threshold_name": threshold_name,
+            "checks": checks,
+            "triggered": triggered,
+            "trigger_rate": triggered / checks,
+            "p50": digest.percentile(50),
+            "p90": digest.percentile(90),
+            "p95": digest.percentile(95),
+            "p99": digest.percentile(99),
+        }
     
     def log_value_distribution(
         self,
@@ -107,19 +284,13 @@ class CalibrationTracker:
         Args:
             parameter_name: Name of parameter (e.g., "quantum_rng.randomness_score")
             value: Parameter value
-            metadata: Additional context
+            metadata: Additional context (not persisted; distribution
+                analysis only needs timestamp/value columns)
         """
-        record = {
-            "timestamp": time.time(),
-            "parameter_name": parameter_name,
-            "value": value,
-            "metadata": metadata or {}
-        }
-        
         try:
-            with open(self.value_distributions_file, "a") as f:
-                f.write(json.dumps(record) + "\n")
-            
+            row = np.array([(time.time(), value)], dtype=_VALUE_DTYPE)
+            self._append(self._value_bin_path(parameter_name), row.tobytes())
+
             self._value_count += 1
         except Exception as e:
             logger.error(f"Failed to log value distribution: {e}")
@@ -152,60 +323,94 @@ class CalibrationTracker:
         Returns:
             Analysis results with recommendations
         """
+        # Make buffered rows visible to the reads below
+        self.flush()
+
+        bin_path = self._hit_bin_path(threshold_name)
+        bin_size = bin_path.stat().st_size if bin_path.exists() else 0
+        cache_key = (threshold_name, bin_size)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return dict(cached)
+
         hits = []
-        
-        try:
-            with open(self.threshold_hits_file, "r") as f:
+
+        # Pre-shard history lives in the monolithic file. Cheap
+        # substring scan before the JSON tokenizer: lines for other
+        # thresholds are skipped without being parsed at all. Two
+        # needles cover orjson (no space) and legacy stdlib output.
+        if self.threshold_hits_file.exists():
+            name = threshold_name.encode()
+            needles = (b'"threshold_name":"' + name + b'"',
+                       b'"threshold_name": "' + name + b'"')
+            with open(self.threshold_hits_file, "rb") as f:
                 for line in f:
-                    record = json.loads(line)
+                    if needles[0] not in line and needles[1] not in line:
+                        continue
+                    record = _json_loads(line)
                     if record["threshold_name"] == threshold_name:
                         hits.append(record)
-        except FileNotFoundError:
-            return {"error": "No data collected yet"}
-        
-        if not hits:
+
+        # The JSONL shard holds only this threshold's records from the
+        # era before the binary columns: no filtering needed.
+        shard_path = self._shard_path(threshold_name)
+        if shard_path.exists():
+            with open(shard_path, "rb") as f:
+                hits.extend(_json_loads(line) for line in f)
+
+        # Current era: fixed-width rows, decoded in one zero-parse read
+        arr = np.fromfile(bin_path, dtype=_HIT_DTYPE) if bin_size else None
+
+        n_bin = len(arr) if arr is not None else 0
+        total_checks = len(hits) + n_bin
+        if total_checks == 0:
             return {"error": f"No data for threshold {threshold_name}"}
-        
-        # Calculate statistics
-        total_checks = len(hits)
+
         triggered_count = sum(1 for h in hits if h["triggered"])
-        trigger_rate = triggered_count / total_checks if total_checks > 0 else 0
-        
-        values = [h["value"] for h in hits]
-        values.sort()
-        
-        # Percentiles
-        def percentile(data, p):
-            k = (len(data) - 1) * p
-            f = int(k)
-            c = k - f
-            if f + 1 < len(data):
-                return data[f] + c * (data[f + 1] - data[f])
-            return data[f]
-        
+        if n_bin:
+            triggered_count += int(arr["triggered"].sum())
+        trigger_rate = triggered_count / total_checks
+
+        # Single vectorized pass: one partition amortized across all
+        # four quantiles instead of a Python-level sort plus indexing
+        parts = []
+        if hits:
+            parts.append(np.fromiter((h["value"] for h in hits), dtype=np.float64, count=len(hits)))
+        if n_bin:
+            parts.append(arr["value"])
+        values = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        p50, p90, p95, p99 = np.percentile(values, [50, 90, 95, 99])
+
+        current_threshold = hits[0]["threshold_value"] if hits else float(arr["threshold"][0])
+
         analysis = {
             "threshold_name": threshold_name,
             "total_checks": total_checks,
             "triggered_count": triggered_count,
             "trigger_rate": trigger_rate,
             "value_stats": {
-                "min": min(values),
-                "max": max(values),
-                "p50": percentile(values, 0.50),
-                "p90": percentile(values, 0.90),
-                "p95": percentile(values, 0.95),
-                "p99": percentile(values, 0.99)
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p95": float(p95),
+                "p99": float(p99)
             },
-            "current_threshold": hits[0]["threshold_value"],
-            "recommendation": self._generate_recommendation(trigger_rate, values, hits[0]["threshold_value"])
+            "current_threshold": current_threshold,
+            "recommendation": self._generate_recommendation(trigger_rate, values, current_threshold)
         }
-        
-        return analysis
+
+        self._analysis_cache[cache_key] = analysis
+        while len(self._analysis_cache) > self._ANALYSIS_CACHE_MAX:
+            self._analysis_cache.popitem(last=False)
+
+        return dict(analysis)
     
     def _generate_recommendation(
         self,
         trigger_rate: float,
-        values: list[float],
+        values: np.ndarray,
         current_threshold: float
     ) -> str:
         """Generate calibration recommendation.